@@ -28,6 +28,9 @@ RECONCILED_JSON = Path(__file__).resolve().parent / "reconciled_identities.json"
 # ── Server ──
 HOST = "0.0.0.0"
 PORT = 3000
+# Frontend is served from the same app, so CORS is only needed when the UI
+# is hosted elsewhere (e.g. a dev server on another port).
+ENABLE_CORS = False
 
 # ── Polling / caching ──
 REFRESH_INTERVAL_SEC = 15
@@ -4,32 +4,64 @@ import csv
 import json
 import logging
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def json_loads(raw: bytes):
+    """Parse UTF-8 JSON bytes (orjson when installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def json_dumps_pretty(obj) -> bytes:
+    """Serialise *obj* as 2-space indented JSON bytes with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n"
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
 # ── mtime cache ──
+# Keyed by str(path); an entry is reused while (st_mtime_ns, st_size) match.
+# Loaders run synchronously from worker threads, so access is guarded.
 _cache: dict[str, dict[str, Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def invalidate(path: Path) -> None:
+    """Drop any cached parse of *path* (call after writing it)."""
+    with _cache_lock:
+        _cache.pop(str(path), None)
 
 
 def _read_with_cache(path: Path, parser):
-    """Return cached data if file mtime hasn't changed, else re-parse."""
+    """Return cached data if file mtime/size haven't changed, else re-parse."""
     key = str(path)
     try:
-        mtime = os.path.getmtime(path)
+        st = os.stat(path)
     except OSError:
         logger.warning("File not found: %s", path)
         return None, f"File not found: {path}"
+    stamp = (st.st_mtime_ns, st.st_size)
 
-    cached = _cache.get(key)
-    if cached and cached["mtime"] == mtime:
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached and cached["stamp"] == stamp:
         return cached["data"], None
 
     try:
         data = parser(path)
-        _cache[key] = {"mtime": mtime, "data": data}
+        with _cache_lock:
+            _cache[key] = {"stamp": stamp, "data": data}
         return data, None
     except Exception as e:
         logger.exception("Error reading %s", path)
@@ -39,20 +71,62 @@ def _read_with_cache(path: Path, parser):
         return None, str(e)
 
 
+# Low-cardinality daily-stats columns. Their values are pooled per load so
+# identical strings share one object (dictionary encoding for the cached rows).
+_POOLED_CSV_COLUMNS = frozenset({
+    "Date", "Assigned To", "Sender", "Risk Level", "Domain Bucket", "Action",
+    "Policy Source", "event_type", "status_after", "assigned_to",
+})
+
+
+def iter_csv_rows(path: Path):
+    """Yield CSV rows as dicts one at a time (bounded memory, uncached).
+
+    Same rows as csv.DictReader, but well-formed lines are built with a single
+    dict(zip()) instead of DictReader's per-row Python checks.
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        width = len(header)
+        pooled = [i for i, name in enumerate(header) if name in _POOLED_CSV_COLUMNS]
+        pool: dict[str, str] = {}
+        intern = pool.setdefault
+        for row in reader:
+            if len(row) == width:
+                for i in pooled:
+                    v = row[i]
+                    row[i] = intern(v, v)
+                yield dict(zip(header, row))
+            elif row:
+                yield _ragged_row(header, row)
+
+
 def load_csv(path: Path) -> tuple[list[dict] | None, str | None]:
     """Load CSV as list of row dicts. Returns (rows, error)."""
     def parser(p):
-        with open(p, "r", encoding="utf-8-sig", newline="") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        return list(iter_csv_rows(p))
     return _read_with_cache(path, parser)
 
 
+def _ragged_row(header: list[str], row: list[str]) -> dict:
+    """Map a short/long CSV line the way csv.DictReader does (None fill / None key)."""
+    d = dict(zip(header, row))
+    if len(row) > len(header):
+        d[None] = row[len(header):]
+    else:
+        for key in header[len(row):]:
+            d[key] = None
+    return d
+
+
 def load_json(path: Path) -> tuple[dict | None, str | None]:
     """Load JSON file. Returns (data, error)."""
     def parser(p):
-        with open(p, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(p, "rb") as f:
+            return json_loads(f.read())
     return _read_with_cache(path, parser)
 
 
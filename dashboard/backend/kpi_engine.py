@@ -5,10 +5,13 @@ format_duration_human, plus new helpers for charts/feeds.
 """
 
 import bisect
+import heapq
 import logging
 import math
 import re
+import threading
 from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -28,11 +31,19 @@ _COMPLETED_TAG_RE = re.compile(r"\[COMPLETED\]", re.IGNORECASE)
 
 def format_duration_human(seconds_value) -> str:
     try:
-        total = int(float(seconds_value))
+        # Engine durations are already floats; only strings need float() first.
+        if isinstance(seconds_value, (int, float)):
+            total = int(seconds_value)
+        else:
+            total = int(float(seconds_value))
     except (TypeError, ValueError):
         return ""
-    if total < 0:
-        total = 0
+    return _format_duration_total(total if total > 0 else 0)
+
+
+@lru_cache(maxsize=8192)
+def _format_duration_total(total: int) -> str:
+    # Durations repeat heavily across feed rows, staff KPIs and polls.
     days, rem = divmod(total, 86400)
     hours, rem = divmod(rem, 3600)
     minutes, seconds = divmod(rem, 60)
@@ -51,7 +62,28 @@ def format_duration_human(seconds_value) -> str:
 def _parse_ts(val: str | None) -> datetime | None:
     if not val or not isinstance(val, str) or not val.strip():
         return None
-    val = val.strip()
+    return _parse_ts_cached(val.strip())
+
+
+@lru_cache(maxsize=65536)
+def _parse_ts_cached(val: str) -> datetime | None:
+    # The bot writes naive ISO-8601 timestamps, so the C fromisoformat path
+    # handles nearly every row; anything it would read differently from the
+    # strptime formats below (date-only, no seconds, tz offsets, more than the
+    # six fractional digits %f takes) falls through.
+    if (
+        len(val) >= 19
+        and val[4] == "-" and val[7] == "-" and val[10] in "T "
+        and val[13] == ":" and val[16] == ":"
+    ):
+        try:
+            dt = datetime.fromisoformat(val)
+        except ValueError:
+            dt = None
+        if dt is not None and dt.tzinfo is None and (
+            len(val) == 19 or (val[10] == "T" and val[19] == "." and len(val) <= 26)
+        ):
+            return dt
     for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
         try:
             return datetime.strptime(val, fmt)
@@ -151,7 +183,9 @@ def _business_seconds(start: datetime, end: datetime) -> float:
     return total
 
 
+@lru_cache(maxsize=4096)
 def _staff_display_name(email: str) -> str:
+    # Called per event/row/job across every view for a small set of addresses.
     local = email.split("@")[0] if "@" in email else email
     return local.replace(".", " ").replace("_", " ").strip().title()
 
@@ -287,7 +321,7 @@ def _matches_staff_filter(email: str, staff_name: str | None) -> bool:
     return staff_target in ((email or "").strip().lower(), _staff_display_name(email).lower())
 
 
-def _resolve_event_ts_for_export(e: dict, kind: str) -> datetime | None:
+def _resolve_event_ts(e: dict, kind: str) -> datetime | None:
     if kind == "assigned":
         ts = e.get("assigned_ts") or e.get("event_ts")
     else:
@@ -300,17 +334,29 @@ def _resolve_event_ts_for_export(e: dict, kind: str) -> datetime | None:
     time_str = time_raw.strip() if isinstance(time_raw, str) else ""
     if not date_str or not time_str:
         return None
-    return _parse_ts(f"{date_str}T{time_str}") or _parse_ts(f"{date_str} {time_str}")
+    # The "T" form is accepted by every format the space form is, so a
+    # second parse attempt with a space separator can never succeed.
+    return _parse_ts(f"{date_str}T{time_str}")
 
 
-def _is_requestor_canonical_event(e: dict) -> bool:
-    event_type = (e.get("event_type") or "").strip().upper()
-    if event_type == "CONFIG_CHANGED":
-        return False
-    if event_type not in ("ASSIGNED", "COMPLETED"):
+_LIFECYCLE_EVENT_TYPES = frozenset(("ASSIGNED", "COMPLETED"))
+_STAFF_KPI_EVENT_TYPES = frozenset(
+    ("ASSIGNED", "COMPLETED", "REASSIGN_MANUAL", "JIRA_FOLLOWUP_ASSIGNED")
+)
+
+
+def _is_reconciliation_only(e: dict) -> bool:
+    event_type = e["event_type"]
+    action = e["action"]
+    return event_type.startswith("RECON") or action.startswith("RECON")
+
+
+def _is_canonical_kpi_event(e: dict, event_types: frozenset = _LIFECYCLE_EVENT_TYPES) -> bool:
+    """True for non-reconciliation lifecycle events that carry a SAMI key."""
+    event_type = e["event_type"]
+    if event_type not in event_types:
         return False
-    action = (e.get("action") or e.get("Action") or "").strip().upper()
-    if event_type.startswith("RECON") or action.startswith("RECON"):
+    if _is_reconciliation_only(e):
         return False
     return bool(_resolve_sami_group_key(e))
 
@@ -341,15 +387,15 @@ def export_requestor_stats(
     activity_mode: str | None = None,
     activity_staff: str | None = None,
 ) -> dict[str, Any]:
-    events = _normalise_rows(rows or [])
-    filtered = [e for e in events if date_start <= (e.get("date") or "") <= date_end]
+    events = _normalised_events(rows or [])
+    filtered = _events_in_range(events, date_start, date_end)
 
     jobs: dict[str, dict[str, Any]] = {}
     for e in events:
-        if not _is_requestor_canonical_event(e):
+        if not _is_canonical_kpi_event(e):
             continue
         key = _resolve_sami_group_key(e)
-        event_type = (e.get("event_type") or "").strip().upper()
+        event_type = e["event_type"]
         job = jobs.setdefault(
             key,
             {
@@ -360,12 +406,12 @@ def export_requestor_stats(
             },
         )
         if event_type == "ASSIGNED":
-            assigned_ts = _resolve_event_ts_for_export(e, "assigned")
+            assigned_ts = _resolve_event_ts(e, "assigned")
             if assigned_ts and (job["assigned_ts"] is None or assigned_ts < job["assigned_ts"]):
                 job["assigned_ts"] = assigned_ts
                 job["assigned_event"] = e
         elif event_type == "COMPLETED":
-            completed_ts = _resolve_event_ts_for_export(e, "completed")
+            completed_ts = _resolve_event_ts(e, "completed")
             if completed_ts and (job["completed_ts"] is None or completed_ts < job["completed_ts"]):
                 job["completed_ts"] = completed_ts
                 job["has_completed"] = True
@@ -376,9 +422,9 @@ def export_requestor_stats(
         key = _resolve_sami_group_key(e)
         if not key:
             continue
-        event_type = (e.get("event_type") or "").strip().upper()
-        action = (e.get("action") or e.get("Action") or "").strip().upper()
-        if event_type == "ASSIGNED" and _is_requestor_canonical_event(e):
+        event_type = e["event_type"]
+        action = e["action"]
+        if event_type == "ASSIGNED" and _is_canonical_kpi_event(e):
             assigned_keys_in_range.add(key)
         if event_type == "JIRA_FOLLOWUP_ASSIGNED" or action == "JIRA_FOLLOWUP":
             jira_followup_keys_in_range.add(key)
@@ -402,7 +448,7 @@ def export_requestor_stats(
         if not isinstance(assigned_event, dict):
             continue
 
-        assigned_email = (assigned_event.get("assigned_to") or "").strip().lower()
+        assigned_email = assigned_event["assigned_to"]
         if not _is_staff(assigned_email):
             continue
         if not _matches_staff_filter(assigned_email, staff_name):
@@ -433,7 +479,7 @@ def export_requestor_stats(
         )
 
         row["total_jobs"] += 1
-        risk_level = (assigned_event.get("risk_level") or "").strip().lower()
+        risk_level = assigned_event["risk_level"]
         if risk_level == "urgent":
             row["urgent_count"] += 1
         elif risk_level == "critical":
@@ -534,7 +580,7 @@ def export_requestor_stats(
         assigned_to_counts = row.pop("assigned_to_counts")
         assigned_to_breakdown = "; ".join(
             f"{_staff_display_name(email)} ({count})"
-            for email, count in sorted(assigned_to_counts.items(), key=lambda item: (-item[1], _staff_display_name(item[0])))[:5]
+            for email, count in heapq.nsmallest(5, assigned_to_counts.items(), key=lambda item: (-item[1], _staff_display_name(item[0])))
         )
         requestor_row = {
             **row,
@@ -677,8 +723,7 @@ def export_requestor_stats(
         )
 
     max_hourly_jobs = max((row["total_jobs"] for row in hourly_rollup.values()), default=0)
-    positive_hour_counts = sorted({row["total_jobs"] for row in hourly_rollup.values() if row["total_jobs"] > 0})
-    slow_threshold = positive_hour_counts[0] if positive_hour_counts else 0
+    slow_threshold = min((row["total_jobs"] for row in hourly_rollup.values() if row["total_jobs"] > 0), default=0)
     hourly_rows = []
     for hour, item in sorted(hourly_rollup.items()):
         load_band = ""
@@ -705,6 +750,11 @@ def export_requestor_stats(
     peak_month = max(monthly_rows, key=lambda row: row["total_jobs"], default=None)
     slow_month = min((row for row in monthly_rows if row["total_jobs"] > 0), key=lambda row: row["total_jobs"], default=None)
 
+    # Sort once; median and P90 are direct reads on the sorted list.
+    overall_sorted = sorted(overall_durations)
+    overall_median = _median(overall_sorted)
+    overall_p90 = _percentile(overall_sorted, 0.9)
+
     summary_rows = [
         {"metric": "date_start", "value": date_start},
         {"metric": "date_end", "value": date_end},
@@ -714,10 +764,10 @@ def export_requestor_stats(
         {"metric": "total_completed_jobs", "value": sum(row["completed_jobs"] for row in requestor_rows)},
         {"metric": "total_urgent", "value": sum(row["urgent_count"] for row in requestor_rows)},
         {"metric": "total_critical", "value": sum(row["critical_count"] for row in requestor_rows)},
-        {"metric": "overall_median_turnaround_sec", "value": round(_median(sorted(overall_durations)), 1) if overall_durations else 0},
-        {"metric": "overall_median_turnaround_human", "value": format_duration_human(_median(sorted(overall_durations))) if overall_durations else ""},
-        {"metric": "overall_p90_turnaround_sec", "value": round(_percentile(sorted(overall_durations), 0.9), 1) if overall_durations else 0},
-        {"metric": "overall_p90_turnaround_human", "value": format_duration_human(_percentile(sorted(overall_durations), 0.9)) if overall_durations else ""},
+        {"metric": "overall_median_turnaround_sec", "value": round(overall_median, 1) if overall_durations else 0},
+        {"metric": "overall_median_turnaround_human", "value": format_duration_human(overall_median) if overall_durations else ""},
+        {"metric": "overall_p90_turnaround_sec", "value": round(overall_p90, 1) if overall_durations else 0},
+        {"metric": "overall_p90_turnaround_human", "value": format_duration_human(overall_p90) if overall_durations else ""},
         {"metric": "peak_day", "value": peak_day["date"] if peak_day else ""},
         {"metric": "slow_day", "value": slow_day["date"] if slow_day else ""},
         {"metric": "peak_hour", "value": peak_hour["hour"] if peak_hour else ""},
@@ -808,14 +858,49 @@ def _compute_hib_burst_status(hib_state: dict | None) -> dict:
 # Event normalisation (port of prepare_event_frame)
 # ─────────────────────────────────────────────
 
+# Action values that mark a row as a completion when event_type is blank.
+_COMPLETION_ACTIONS = frozenset({
+    "STAFF_COMPLETED_CONFIRMATION",
+    "COMPLETION_SUBJECT_KEYWORD",
+    "COMPLETION_MATCHED",
+    "COMPLETION_UNMATCHED",
+    "COMPLETION_LINKED_TO_ASSIGNMENT",
+    "COMPLETION_NOT_LINKED_TO_ASSIGNMENT",
+    "COMPLETION_SWEEP",
+})
+
+
 def _normalise_rows(rows: list[dict]) -> list[dict]:
-    """Normalise raw CSV rows into event dicts with computed fields."""
+    """Normalise raw CSV rows into event dicts with computed fields.
+
+    Each raw column is read and cleaned exactly once per row; heartbeats are
+    rejected before any of the remaining columns are touched.
+
+    Case-folded columns are low-cardinality (a few actions, event types,
+    risk levels and staff addresses), so each distinct raw value is folded
+    once per call and every event shares the resulting string.
+    """
+    lowered: dict[Any, str] = {}
+    uppered: dict[Any, str] = {}
+
+    def _lower(raw: Any) -> str:
+        value = lowered.get(raw)
+        if value is None:
+            value = lowered[raw] = (raw or "").strip().lower()
+        return value
+
+    def _upper(raw: Any) -> str:
+        value = uppered.get(raw)
+        if value is None:
+            value = uppered[raw] = (raw or "").strip().upper()
+        return value
+
     out = []
+    append = out.append
     for row in rows:
-        event_type_raw = (row.get("event_type") or "").strip().upper()
-        action_raw = (row.get("Action") or "").strip().upper()
-        risk_level = (row.get("Risk Level") or "").strip().lower()
-        msg_key = (row.get("msg_key") or "").strip().lower()
+        get = row.get
+        action_raw = _upper(get("Action"))
+        risk_level = _lower(get("Risk Level"))
 
         # Skip heartbeats
         if risk_level == "heartbeat" or action_raw == "HEARTBEAT":
@@ -827,36 +912,29 @@ def _normalise_rows(rows: list[dict]) -> list[dict]:
             risk_level = "normal"
 
         # Completion detection from Action column
-        if not event_type_raw and action_raw in (
-            "STAFF_COMPLETED_CONFIRMATION",
-            "COMPLETION_SUBJECT_KEYWORD",
-            "COMPLETION_MATCHED",
-            "COMPLETION_UNMATCHED",
-            "COMPLETION_LINKED_TO_ASSIGNMENT",
-            "COMPLETION_NOT_LINKED_TO_ASSIGNMENT",
-            "COMPLETION_SWEEP",
-        ):
+        event_type_raw = _upper(get("event_type"))
+        if not event_type_raw and action_raw in _COMPLETION_ACTIONS:
             event_type_raw = "COMPLETED"
 
         # assigned_to with fallback to "Assigned To"
-        assigned_to = (row.get("assigned_to") or "").strip().lower()
+        assigned_to = _lower(get("assigned_to"))
         if not assigned_to:
-            assigned_to = (row.get("Assigned To") or "").strip().lower()
-
-        # Filter non-staff
-        if assigned_to in config.NON_STAFF_ASSIGNEES:
-            # Keep for activity feed but mark
-            pass
+            assigned_to = _lower(get("Assigned To"))
 
         # Timestamps
-        assigned_ts = _parse_ts(row.get("assigned_ts"))
-        completed_ts = _parse_ts(row.get("completed_ts"))
+        assigned_ts = _parse_ts(get("assigned_ts"))
+        completed_ts = _parse_ts(get("completed_ts"))
 
-        # Duration
-        duration_sec = _safe_float(row.get("duration_sec"))
+        # Duration. Most rows leave the column blank; test that before
+        # _safe_float so they skip its float("") ValueError round-trip.
+        duration_raw = get("duration_sec")
+        duration_sec = _safe_float(duration_raw) if duration_raw not in (None, "") else None
         if duration_sec is None and assigned_ts and completed_ts:
             duration_sec = max(0.0, _business_seconds(assigned_ts, completed_ts))
 
+        date_str = (get("Date") or "").strip()
+        time_str = (get("Time") or "").strip()
+
         # Event timestamp for sorting
         if event_type_raw == "COMPLETED" and completed_ts:
             event_ts = completed_ts
@@ -864,22 +942,21 @@ def _normalise_rows(rows: list[dict]) -> list[dict]:
             event_ts = assigned_ts
         else:
             # Try to build from Date + Time columns
-            date_str = (row.get("Date") or "").strip()
-            time_str = (row.get("Time") or "").strip()
             event_ts = _parse_ts(f"{date_str}T{time_str}") if date_str and time_str else None
 
-        out.append({
-            "date": (row.get("Date") or "").strip(),
-            "time": (row.get("Time") or "").strip(),
-            "subject": (row.get("Subject") or "").strip(),
+        sami_id = get("sami_id")
+        append({
+            "date": date_str,
+            "time": time_str,
+            "subject": (get("Subject") or "").strip(),
             "assigned_to": assigned_to,
-            "sender": (row.get("Sender") or "").strip().lower(),
+            "sender": _lower(get("Sender")),
             "risk_level": risk_level,
-            "domain_bucket": (row.get("Domain Bucket") or "").strip(),
+            "domain_bucket": (get("Domain Bucket") or "").strip(),
             "action": action_raw,
             "event_type": event_type_raw,
-            "msg_key": msg_key,
-            "sami_id": (row.get("sami_id") or "").strip() if "sami_id" in row else "",
+            "msg_key": (get("msg_key") or "").strip().lower(),
+            "sami_id": (sami_id or "").strip(),
             "assigned_ts": assigned_ts,
             "completed_ts": completed_ts,
             "duration_sec": duration_sec,
@@ -888,6 +965,45 @@ def _normalise_rows(rows: list[dict]) -> list[dict]:
     return out
 
 
+# Last normalisation result. load_csv hands back the same cached list until
+# the CSV changes, so every view computed from one load reuses one pass.
+_normalised_cache: dict[str, Any] = {"rows": None, "count": -1, "events": []}
+_normalised_lock = threading.Lock()
+
+
+def _normalised_events(rows: list[dict]) -> list[dict]:
+    """Return _normalise_rows(rows), reusing the previous result for the same list.
+
+    Callers treat the returned events as read-only.
+    """
+    with _normalised_lock:
+        if _normalised_cache["rows"] is rows and _normalised_cache["count"] == len(rows):
+            return _normalised_cache["events"]
+    events = _normalise_rows(rows)
+    with _normalised_lock:
+        _normalised_cache.update(rows=rows, count=len(rows), events=events)
+    return events
+
+
+_range_cache: dict[str, Any] = {"events": None, "key": None, "filtered": []}
+
+
+def _events_in_range(events: list[dict], date_start: str, date_end: str) -> list[dict]:
+    """Events whose date falls in [date_start, date_end] (read-only list).
+
+    Dashboard polls repeat the same window over the same cached events, so
+    the last slice is reused instead of being rebuilt on every request.
+    """
+    key = (len(events), date_start, date_end)
+    with _normalised_lock:
+        if _range_cache["events"] is events and _range_cache["key"] == key:
+            return _range_cache["filtered"]
+    filtered = [e for e in events if date_start <= (e["date"] or "") <= date_end]
+    with _normalised_lock:
+        _range_cache.update(events=events, key=key, filtered=filtered)
+    return filtered
+
+
 def _is_staff(email: str) -> bool:
     return bool(email) and email not in config.NON_STAFF_ASSIGNEES and "@" in email
 
@@ -903,8 +1019,8 @@ def export_staff_events(rows: list[dict], staff_name: str,
     Each dict has: Date, Time, Type, Subject, Sender, Source, Risk Level,
     Domain, Duration.
     """
-    events = _normalise_rows(rows)
-    filtered = [e for e in events if date_start <= (e["date"] or "") <= date_end]
+    events = _normalised_events(rows)
+    filtered = _events_in_range(events, date_start, date_end)
 
     # Build msg_key → assigned_to lookup so COMPLETED events can resolve staff
     assigned_staff: dict[str, str] = {}
@@ -921,14 +1037,14 @@ def export_staff_events(rows: list[dict], staff_name: str,
             continue
 
         # Resolve staff email for this event
-        staff_email = (e.get("assigned_to") or "").strip().lower()
+        staff_email = e["assigned_to"]
 
         if et == "COMPLETED" and not _is_staff(staff_email):
             # 3-step fallback: assigned_to → msg_key lookup → sender
             if e.get("msg_key"):
                 staff_email = assigned_staff.get(e["msg_key"], staff_email)
             if not _is_staff(staff_email):
-                sender = (e.get("sender") or "").strip().lower()
+                sender = e["sender"]
                 if _is_staff(sender):
                     staff_email = sender
 
@@ -1003,7 +1119,7 @@ def _normalise_subject_for_completion_match(subject: str) -> str:
 
 
 def _legacy_group_key(e: dict) -> str:
-    return (e.get("msg_key") or "").strip().lower()
+    return e["msg_key"]
 
 
 def _resolve_group_key(e: dict) -> str:
@@ -1025,7 +1141,7 @@ def _active_identity_key(e: dict) -> str:
     sami_ref = _display_sami_ref(e)
     if sami_ref:
         return sami_ref
-    msg_key = (e.get("msg_key") or "").strip().lower()
+    msg_key = e["msg_key"]
     if msg_key:
         return f"msg:{msg_key}"
     return ""
@@ -1034,44 +1150,38 @@ def _active_identity_key(e: dict) -> str:
 def _collect_active_identity_rows(rows: list[dict], date_end: str, staff_name: str | None = None,
                                   date_start: str | None = None) -> list[dict]:
     """Return likely-open ticket identities as of *date_end* before reconciliation filtering."""
-    events = _normalise_rows(rows)
-    candidates = [
-        e for e in events
-        if e.get("event_type") in ("ASSIGNED", "REASSIGN_MANUAL", "STALE_RELOOP", "MANUAL_STALE_RELEASE") and (not (e.get("date") or "") or (e.get("date") or "") <= date_end)
-    ]
+    events = _normalised_events(rows)
 
     staff_target = (staff_name or "").strip().lower()
     _ = date_start
 
+    # One pass over events up to date_end: collect assignment candidates,
+    # completion indexes, manual releases and base assignment rows together.
+    candidates: list[dict] = []
     completed_sami_keys: set[str] = set()
     completed_by_identity_ts: dict[str, datetime | None] = {}
-    for e in events:
-        event_type = (e.get("event_type") or "").strip().upper()
-        if event_type not in ("COMPLETED", "FILTER_JONES_COMPLETION", "COMPLETION_SWEEP"):
-            continue
-        if (e.get("date") or "") > date_end:
-            continue
-        sami_key = _resolve_sami_group_key(e)
-        if sami_key:
-            completed_sami_keys.add(sami_key)
-        identity = _active_identity_key(e)
-        if not identity:
-            continue
-        current_ts = e.get("event_ts")
-        previous_ts = completed_by_identity_ts.get(identity)
-        if previous_ts is None or (current_ts and current_ts >= previous_ts):
-            completed_by_identity_ts[identity] = current_ts
-
     manual_release_by_identity_ts: dict[str, datetime | None] = {}
     base_event_by_identity: dict[str, dict] = {}
     for e in events:
-        event_type = (e.get("event_type") or "").strip().upper()
         if (e.get("date") or "") > date_end:
             continue
+        if e.get("event_type") in ("ASSIGNED", "REASSIGN_MANUAL", "STALE_RELOOP", "MANUAL_STALE_RELEASE"):
+            candidates.append(e)
+        event_type = e["event_type"]
+        is_completion = event_type in ("COMPLETED", "FILTER_JONES_COMPLETION", "COMPLETION_SWEEP")
+        if is_completion:
+            sami_key = _resolve_sami_group_key(e)
+            if sami_key:
+                completed_sami_keys.add(sami_key)
         identity = _active_identity_key(e)
         if not identity:
             continue
         current_ts = e.get("event_ts")
+        if is_completion:
+            previous_ts = completed_by_identity_ts.get(identity)
+            if previous_ts is None or (current_ts and current_ts >= previous_ts):
+                completed_by_identity_ts[identity] = current_ts
+            continue
         if event_type in ("ASSIGNED", "REASSIGN_MANUAL"):
             existing_base = base_event_by_identity.get(identity)
             if existing_base is None:
@@ -1082,7 +1192,7 @@ def _collect_active_identity_rows(rows: list[dict], date_end: str, staff_name: s
                     base_event_by_identity[identity] = e
         if event_type != "MANUAL_STALE_RELEASE":
             continue
-        assigned_to = (e.get("assigned_to") or "").strip().lower()
+        assigned_to = e["assigned_to"]
         if _is_staff(assigned_to):
             continue
         previous_ts = manual_release_by_identity_ts.get(identity)
@@ -1091,7 +1201,7 @@ def _collect_active_identity_rows(rows: list[dict], date_end: str, staff_name: s
 
     latest_by_identity: dict[str, dict] = {}
     for e in candidates:
-        staff_email = (e.get("assigned_to") or "").strip().lower()
+        staff_email = e["assigned_to"]
         if not _is_staff(staff_email):
             continue
 
@@ -1099,10 +1209,10 @@ def _collect_active_identity_rows(rows: list[dict], date_end: str, staff_name: s
 
         subject = e.get("subject") or ""
         sami_ref = _display_sami_ref(e)
-        msg_key = (e.get("msg_key") or "").strip().lower()
+        msg_key = e["msg_key"]
         sami_key = _resolve_sami_group_key(e)
         current_ts = e.get("event_ts")
-        event_type = (e.get("event_type") or "").strip().upper()
+        event_type = e["event_type"]
 
         # STALE_RELOOP rows are operational reloop artifacts for SAMI-backed tickets; current owner comes from the ledger.
         if event_type == "STALE_RELOOP" and sami_ref:
@@ -1150,10 +1260,9 @@ def _collect_active_identity_rows(rows: list[dict], date_end: str, staff_name: s
             "event_ts": current_ts,
         }
 
-    rows_out = list(latest_by_identity.values())
     ledger_by_sami, ledger_by_msg_key = _load_processed_ledger_indexes()
     filtered_rows: list[dict] = []
-    for row in rows_out:
+    for row in latest_by_identity.values():
         sami_ref = (row.get("SAMI Ref") or "").strip().upper()
         msg_key = (row.get("Message Key") or "").strip().lower()
         entry = ledger_by_sami.get(sami_ref) if sami_ref else ledger_by_msg_key.get(msg_key)
@@ -1185,18 +1294,55 @@ def export_active_events(rows: list[dict], date_start: str, date_end: str,
                          reconciled_set: set[str] | None = None) -> list[dict]:
     """Return likely-open SAMI-backed tickets as of date_end for CSV/export."""
     _ = date_start
-    rows_out = [
-        r for r in _collect_active_identity_rows(rows, date_end, staff_name=staff_name, date_start=date_start)
-        if (r.get("SAMI Ref") or "").strip()
-    ]
-
-    # Filter out reconciled identities BEFORE aggregation/output
-    if reconciled_set:
-        rows_out = [r for r in rows_out if r.get("Identity") not in reconciled_set]
-    for r in rows_out:
+    rows_out = []
+    for r in _collect_active_identity_rows(rows, date_end, staff_name=staff_name, date_start=date_start):
+        if not (r.get("SAMI Ref") or "").strip():
+            continue
+        # Filter out reconciled identities BEFORE aggregation/output
+        if reconciled_set and r.get("Identity") in reconciled_set:
+            continue
         r.pop("event_ts", None)
+        rows_out.append(r)
     return rows_out
 
+def _earliest_heartbeat(rows: list[dict]) -> datetime | None:
+    """Earliest HEARTBEAT Date/Time in raw rows.
+
+    Heartbeats are written every tick, so rather than strptime-ing each one,
+    zero-padded stamps are compared as strings and only the minimum parsed.
+    """
+    padded: list[str] = []
+    other: list[str] = []
+    for r in rows:
+        action_raw = (r.get("Action") or "").strip().upper()
+        risk_raw = (r.get("Risk Level") or "").strip().lower()
+        if action_raw == "HEARTBEAT" or risk_raw == "heartbeat":
+            date_str = (r.get("Date") or "").strip()
+            time_str = (r.get("Time") or "").strip()
+            if date_str and time_str:
+                dt_str = f"{date_str} {time_str}"
+                if len(date_str) == 10 and len(time_str) == 8:
+                    padded.append(dt_str)
+                else:
+                    other.append(dt_str)
+
+    first_hb = None
+    if padded:
+        try:
+            first_hb = datetime.strptime(min(padded), "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            # Malformed minimum; fall back to parsing every stamp.
+            other.extend(padded)
+    for dt_str in other:
+        try:
+            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            continue
+        if first_hb is None or dt < first_hb:
+            first_hb = dt
+    return first_hb
+
+
 def compute_dashboard(rows: list[dict] | None, roster_state: dict | None,
                       settings: dict | None, staff_list: list[str] | None = None,
                       hib_state: dict | None = None,
@@ -1225,47 +1371,21 @@ def compute_dashboard(rows: list[dict] | None, roster_state: dict | None,
         ds = date_start or "2000-01-01"
         de = date_end or "2099-12-31"
 
-    events = _normalise_rows(rows)
-    filtered = [e for e in events if ds <= (e["date"] or "") <= de]
+    events = _normalised_events(rows)
+    filtered = _events_in_range(events, ds, de)
 
     # ── Summary cards (canonical SAMI lifecycle) ──
-    def _resolve_received_ts(e: dict, kind: str) -> datetime | None:
-        if kind == "assigned":
-            ts = e.get("assigned_ts") or e.get("event_ts")
-        else:
-            ts = e.get("completed_ts") or e.get("event_ts")
-        if ts:
-            return ts
-
-        date_raw = e.get("date") or e.get("Date")
-        time_raw = e.get("time") or e.get("Time")
-        date_str = date_raw.strip() if isinstance(date_raw, str) else ""
-        time_str = time_raw.strip() if isinstance(time_raw, str) else ""
-        if not date_str or not time_str:
-            return None
-        return _parse_ts(f"{date_str}T{time_str}") or _parse_ts(f"{date_str} {time_str}")
-
-    def _is_reconciliation_only(e: dict) -> bool:
-        event_type = (e.get("event_type") or "").strip().upper()
-        action = (e.get("action") or e.get("Action") or "").strip().upper()
-        return event_type.startswith("RECON") or action.startswith("RECON")
-
-    def _is_canonical_kpi_event(e: dict) -> bool:
-        event_type = (e.get("event_type") or "").strip().upper()
-        if event_type == "CONFIG_CHANGED":
-            return False
-        if event_type not in ("ASSIGNED", "COMPLETED"):
-            return False
-        if _is_reconciliation_only(e):
-            return False
-        return bool(_resolve_sami_group_key(e))
-
+    # Single pass over events: build per-SAMI jobs and the in-range key sets
+    # together (filtered is a date-range subset of events).
     jobs: dict[str, dict[str, Any]] = {}
+    assigned_keys_in_range: set[str] = set()
+    completed_keys_in_range: set[str] = set()
     for e in events:
         if not _is_canonical_kpi_event(e):
             continue
         key = _resolve_sami_group_key(e)
-        event_type = (e.get("event_type") or "").strip().upper()
+        event_type = e["event_type"]
+        in_range = ds <= (e["date"] or "") <= de
         job = jobs.setdefault(
             key,
             {
@@ -1281,31 +1401,20 @@ def compute_dashboard(rows: list[dict] | None, roster_state: dict | None,
 
         if event_type == "ASSIGNED":
             job["has_assigned"] = True
-            assigned_ts = _resolve_received_ts(e, "assigned")
+            if in_range:
+                assigned_keys_in_range.add(key)
+            assigned_ts = _resolve_event_ts(e, "assigned")
             if assigned_ts and (job["assigned_ts"] is None or assigned_ts < job["assigned_ts"]):
                 job["assigned_ts"] = assigned_ts
                 job["assigned_event"] = e
         elif event_type == "COMPLETED":
             job["has_completed"] = True
-            completed_ts = _resolve_received_ts(e, "completed")
+            if in_range:
+                completed_keys_in_range.add(key)
+            completed_ts = _resolve_event_ts(e, "completed")
             if completed_ts and (job["completed_ts"] is None or completed_ts < job["completed_ts"]):
                 job["completed_ts"] = completed_ts
 
-    assigned_keys_in_range: set[str] = set()
-    completed_keys_in_range: set[str] = set()
-    latest_assignment_events_in_range: set[tuple] = set()
-    for e in filtered:
-        if not _is_canonical_kpi_event(e):
-            continue
-        key = _resolve_sami_group_key(e)
-        event_type = (e.get("event_type") or "").strip().upper()
-        if event_type == "ASSIGNED":
-            assigned_keys_in_range.add(key)
-        elif event_type == "COMPLETED":
-            completed_keys_in_range.add(key)
-        if event_type in ("REASSIGN_MANUAL", "JIRA_FOLLOWUP_ASSIGNED"):
-            latest_assignment_events_in_range.add(_event_key(e))
-
     processed_keys: set[str] = set()
     processed_in_range_keys: set[str] = set()
     completed_matched_keys: set[str] = set()
@@ -1313,7 +1422,7 @@ def compute_dashboard(rows: list[dict] | None, roster_state: dict | None,
         assigned_event = job.get("assigned_event")
         if not assigned_event:
             continue
-        assigned_email = (assigned_event.get("assigned_to") or "").strip().lower()
+        assigned_email = assigned_event["assigned_to"]
         if not _is_staff(assigned_email):
             continue
         if job.get("has_assigned"):
@@ -1351,8 +1460,9 @@ def compute_dashboard(rows: list[dict] | None, roster_state: dict | None,
     active_staff = len(staff_list) if staff_list else 0
 
     # Avg completion time — canonical SAMI lifecycle durations
-    # (identical algorithm to per-staff KPIs)
-    durations = []
+    # (identical algorithm to per-staff KPIs). The same per-SAMI durations
+    # feed the activity feed, so each is computed once here.
+    _canonical_sami_durations: dict[str, float] = {}
     suppressed_count = 0
     for key in completed_matched_keys:
         job = jobs.get(key)
@@ -1370,38 +1480,13 @@ def compute_dashboard(rows: list[dict] | None, roster_state: dict | None,
         if dur > _DURATION_MISMATCH_SEC:
             suppressed_count += 1
             continue
-        durations.append(dur)
+        _canonical_sami_durations[key] = dur
+    durations = list(_canonical_sami_durations.values())
 
     avg_time_sec = sum(durations) / len(durations) if durations else 0
 
-    # Canonical SAMI durations lookup — shared with activity feed
-    _canonical_sami_durations: dict[str, float] = {}
-    for key in completed_matched_keys:
-        job = jobs.get(key)
-        if not job:
-            continue
-        a_ts, c_ts = job.get("assigned_ts"), job.get("completed_ts")
-        if a_ts and c_ts:
-            d = _business_seconds(a_ts, c_ts)
-            if 0 < d <= _DURATION_HARD_CAP_SEC and d <= _DURATION_MISMATCH_SEC:
-                _canonical_sami_durations[key] = d
-
     # Uptime: find earliest HEARTBEAT in raw rows for today
-    first_hb = None
-    for r in rows:
-        action_raw = (r.get("Action") or "").strip().upper()
-        risk_raw = (r.get("Risk Level") or "").strip().lower()
-        if action_raw == "HEARTBEAT" or risk_raw == "heartbeat":
-            date_str = (r.get("Date") or "").strip()
-            time_str = (r.get("Time") or "").strip()
-            if date_str and time_str:
-                dt_str = f"{date_str} {time_str}"
-                try:
-                    dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
-                    if first_hb is None or dt < first_hb:
-                        first_hb = dt
-                except ValueError:
-                    continue
+    first_hb = _earliest_heartbeat(rows)
 
     uptime_str = None
     if first_hb:
@@ -1451,7 +1536,7 @@ def compute_dashboard(rows: list[dict] | None, roster_state: dict | None,
                 _rps[email] += 1
         _reconciled_per_staff = _rps
 
-    staff_kpis = _compute_staff_kpis(
+    staff_kpis = _cached_staff_kpis(
         filtered,
         events,
         date_start=ds,
@@ -1464,19 +1549,8 @@ def compute_dashboard(rows: list[dict] | None, roster_state: dict | None,
     hourly = _compute_hourly(filtered)
     hourly_detail = _compute_hourly_detail(filtered)
 
-    # ── Risk level distribution ──
-    risk_dist = _compute_distribution(filtered, "risk_level",
-                                       exclude={"heartbeat", ""})
-
-    # ── Domain bucket distribution ──
-    domain_dist = _compute_distribution(filtered, "domain_bucket",
-                                         exclude={""})
-
-    # ── Assignment pie (staff only) ──
-    assignment_pie = _compute_distribution(
-        [e for e in filtered if e["event_type"] == "ASSIGNED" and _is_staff(e["assigned_to"])],
-        "assigned_to"
-    )
+    # ── Risk level / domain bucket distributions + assignment pie (staff only) ──
+    risk_dist, domain_dist, assignment_pie = _compute_range_distributions(filtered)
     assignment_pie = {
         _staff_display_name(k): v for k, v in assignment_pie.items()
     }
@@ -1553,14 +1627,49 @@ def _compute_requestor_distribution(events: list[dict], top_n: int = 15) -> dict
     if not counts:
         return {}
 
-    sorted_items = sorted(counts.items(), key=lambda x: -x[1])
-    top = dict(sorted_items[:top_n])
-    other = sum(v for _, v in sorted_items[top_n:])
+    top = dict(heapq.nlargest(top_n, counts.items(), key=lambda x: x[1]))
+    other = sum(counts.values()) - sum(top.values())
     if other > 0:
         top["Other"] = other
     return top
 
 
+# Last staff KPI table, keyed by the normalised event list it was built from
+# plus every other input. Polls with unchanged data skip the lifecycle pass.
+_staff_kpi_cache: dict[str, Any] = {"events": None, "key": None, "result": []}
+_staff_kpi_lock = threading.Lock()
+
+
+def _cached_staff_kpis(filtered: list[dict], all_events: list[dict],
+                       date_start: str | None = None,
+                       date_end: str | None = None,
+                       reconciled_per_staff: dict[str, int] | None = None,
+                       active_by_staff: dict[str, int] | None = None) -> list[dict]:
+    """_compute_staff_kpis() memoised on its inputs; returns fresh row dicts."""
+    key = (
+        len(all_events),
+        len(filtered),
+        date_start,
+        date_end,
+        None if reconciled_per_staff is None else tuple(sorted(reconciled_per_staff.items())),
+        None if active_by_staff is None else tuple(sorted(active_by_staff.items())),
+    )
+    with _staff_kpi_lock:
+        if _staff_kpi_cache["events"] is all_events and _staff_kpi_cache["key"] == key:
+            return [dict(row) for row in _staff_kpi_cache["result"]]
+    result = _compute_staff_kpis(
+        filtered,
+        all_events,
+        date_start=date_start,
+        date_end=date_end,
+        reconciled_per_staff=reconciled_per_staff,
+        active_by_staff=active_by_staff,
+    )
+    with _staff_kpi_lock:
+        _staff_kpi_cache.update(events=all_events, key=key, result=result)
+    return [dict(row) for row in result]
+
+
 def _compute_staff_kpis(filtered: list[dict], all_events: list[dict] | None = None,
                         date_start: str | None = None,
                         date_end: str | None = None,
@@ -1588,52 +1697,30 @@ def _compute_staff_kpis(filtered: list[dict], all_events: list[dict] | None = No
     staff_durations: dict[str, list[float]] = defaultdict(list)
     canonical_staff_emails: set[str] = set()
 
-    def _resolve_received_ts(e: dict, kind: str) -> datetime | None:
-        """Resolve best available timestamp for assignment/completion time."""
-        if kind == "assigned":
-            ts = e.get("assigned_ts") or e.get("event_ts")
-        else:
-            ts = e.get("completed_ts") or e.get("event_ts")
-        if ts:
-            return ts
-
-        date_raw = e.get("date") or e.get("Date")
-        time_raw = e.get("time") or e.get("Time")
-        date_str = date_raw.strip() if isinstance(date_raw, str) else ""
-        time_str = time_raw.strip() if isinstance(time_raw, str) else ""
-        if not date_str or not time_str:
-            return None
-
-        return _parse_ts(f"{date_str}T{time_str}") or _parse_ts(f"{date_str} {time_str}")
-
-    def _is_reconciliation_only(e: dict) -> bool:
-        event_type = (e.get("event_type") or "").strip().upper()
-        action = (e.get("action") or e.get("Action") or "").strip().upper()
-        return event_type.startswith("RECON") or action.startswith("RECON")
-
-    def _is_canonical_kpi_event(e: dict) -> bool:
-        event_type = (e.get("event_type") or "").strip().upper()
-        if event_type == "CONFIG_CHANGED":
-            return False
-        if event_type not in ("ASSIGNED", "COMPLETED", "REASSIGN_MANUAL", "JIRA_FOLLOWUP_ASSIGNED"):
-            return False
-        if _is_reconciliation_only(e):
-            return False
-        return bool(_resolve_sami_group_key(e))
-
     source_events = all_events if all_events is not None else filtered
-    source_events = [
-        e for e in source_events
-        if not (date_end and (e.get("date") or "") and (e.get("date") or "") > date_end)
-    ]
 
     # Canonical job lifecycle by SAMI: latest owner as of date_end + earliest COMPLETED.
+    # The same pass records per-range keys (a SAMI contributes at most once per
+    # metric in the filtered range); filtered is a subset of source_events.
+    filtered_ids = None if all_events is None else {id(e) for e in filtered}
     jobs: dict[str, dict[str, Any]] = {}
+    assigned_keys_in_range: set[str] = set()
+    completed_keys_in_range: set[str] = set()
+    latest_assignment_event_ids_in_range: set[int] = set()
     for e in source_events:
-        if not _is_canonical_kpi_event(e):
+        if date_end and (e.get("date") or "") > date_end:
+            continue
+        if not _is_canonical_kpi_event(e, _STAFF_KPI_EVENT_TYPES):
             continue
         key = _resolve_sami_group_key(e)
-        event_type = (e.get("event_type") or "").strip().upper()
+        event_type = e["event_type"]
+        if filtered_ids is None or id(e) in filtered_ids:
+            if event_type == "ASSIGNED":
+                assigned_keys_in_range.add(key)
+            elif event_type == "COMPLETED":
+                completed_keys_in_range.add(key)
+            if event_type in ("REASSIGN_MANUAL", "JIRA_FOLLOWUP_ASSIGNED"):
+                latest_assignment_event_ids_in_range.add(id(e))
         job = jobs.setdefault(
             key,
             {
@@ -1645,13 +1732,13 @@ def _compute_staff_kpis(filtered: list[dict], all_events: list[dict] | None = No
             },
         )
 
-        action = (e.get("action") or e.get("Action") or "").strip().upper()
+        action = e["action"]
         if event_type == "JIRA_FOLLOWUP_ASSIGNED" or action == "JIRA_FOLLOWUP":
             job["is_jira_followup"] = True
 
         if event_type in ("ASSIGNED", "REASSIGN_MANUAL", "JIRA_FOLLOWUP_ASSIGNED"):
             job["has_assigned"] = True
-            assigned_ts = _resolve_received_ts(e, "assigned")
+            assigned_ts = _resolve_event_ts(e, "assigned")
             if event_type in ("ASSIGNED", "JIRA_FOLLOWUP_ASSIGNED") and job.get("initial_assigned_event") is None:
                 job["initial_assigned_event"] = e
             if assigned_ts and (job["assigned_ts"] is None or assigned_ts >= job["assigned_ts"]):
@@ -1659,44 +1746,28 @@ def _compute_staff_kpis(filtered: list[dict], all_events: list[dict] | None = No
                 job["assigned_event"] = e
         elif event_type == "COMPLETED":
             job["has_completed"] = True
-            completed_ts = _resolve_received_ts(e, "completed")
+            completed_ts = _resolve_event_ts(e, "completed")
             if completed_ts and (job["completed_ts"] is None or completed_ts < job["completed_ts"]):
                 job["completed_ts"] = completed_ts
 
-    # Per-range dedupe: a SAMI contributes at most once per metric in filtered range.
-    assigned_keys_in_range: set[str] = set()
-    completed_keys_in_range: set[str] = set()
-    latest_assignment_events_in_range: set[tuple] = set()
-    for e in filtered:
-        if not _is_canonical_kpi_event(e):
-            continue
-        key = _resolve_sami_group_key(e)
-        event_type = (e.get("event_type") or "").strip().upper()
-        if event_type == "ASSIGNED":
-            assigned_keys_in_range.add(key)
-        elif event_type == "COMPLETED":
-            completed_keys_in_range.add(key)
-        if event_type in ("REASSIGN_MANUAL", "JIRA_FOLLOWUP_ASSIGNED"):
-            latest_assignment_events_in_range.add(_event_key(e))
-
     for key, job in jobs.items():
         assigned_event = job.get("assigned_event")
         if not assigned_event:
             continue
 
-        assigned_email = (assigned_event.get("assigned_to") or "").strip().lower()
+        assigned_email = assigned_event["assigned_to"]
         if not _is_staff(assigned_email):
             continue
         canonical_staff_emails.add(assigned_email)
 
         initial_assigned_event = job.get("initial_assigned_event")
-        initial_email = (initial_assigned_event.get("assigned_to") or "").strip().lower() if initial_assigned_event else assigned_email
+        initial_email = initial_assigned_event["assigned_to"] if initial_assigned_event else assigned_email
 
         if job.get("has_assigned"):
             staff_assigned[assigned_email] += 1
         if key in assigned_keys_in_range:
             staff_assigned_in_range[assigned_email] += 1
-        if job.get("is_jira_followup") and initial_email and _is_staff(initial_email) and (assigned_event.get("event_type") or "").strip().upper() == "JIRA_FOLLOWUP_ASSIGNED" and _event_key(assigned_event) in latest_assignment_events_in_range:
+        if job.get("is_jira_followup") and initial_email and _is_staff(initial_email) and assigned_event["event_type"] == "JIRA_FOLLOWUP_ASSIGNED" and id(assigned_event) in latest_assignment_event_ids_in_range:
             staff_jira_followups[initial_email] += 1
         if key in completed_keys_in_range and job.get("has_completed"):
             staff_completed[assigned_email] += 1
@@ -1719,21 +1790,17 @@ def _compute_staff_kpis(filtered: list[dict], all_events: list[dict] | None = No
             if count > 0 and email in canonical_staff_emails
         }
 
-    all_emails = set(staff_assigned) | set(staff_completed) | set(staff_jira_followups) | set(reconciled_per_staff or {})
-    if external_active_by_staff:
-        all_emails |= set(canonical_active_by_staff)
-    else:
-        all_emails |= set(staff_active)
+    active_counts = canonical_active_by_staff if external_active_by_staff else staff_active
+    all_emails = set(staff_assigned).union(
+        staff_completed, staff_jira_followups, reconciled_per_staff or (), active_counts
+    )
     result = []
-    for email in sorted(all_emails):
+    for email in all_emails:
         assigned = staff_assigned.get(email, 0)
         completed = staff_completed.get(email, 0) + (reconciled_per_staff.get(email, 0) if reconciled_per_staff else 0)
-        if external_active_by_staff:
-            active = canonical_active_by_staff.get(email, 0)
-        else:
-            active = staff_active.get(email, 0)
+        active = active_counts.get(email, 0)
 
-        durations_min = sorted([d / 60.0 for d in staff_durations.get(email, [])])
+        durations_min = [d / 60.0 for d in sorted(staff_durations.get(email, ()))]
         median_min = round(_median(durations_min), 1) if durations_min else None
         p90_min = round(_percentile(durations_min, 0.9), 1) if durations_min else None
         low_confidence = False
@@ -1753,7 +1820,8 @@ def _compute_staff_kpis(filtered: list[dict], all_events: list[dict] | None = No
             "p90_human": format_duration_human((p90_min or 0) * 60) if p90_min else None,
         })
 
-    result.sort(key=lambda x: (-x["assigned"], x["name"]))
+    # email breaks name ties, matching the old sorted(all_emails) pre-pass.
+    result.sort(key=lambda x: (-x["assigned"], x["name"], x["email"]))
     return result
 
 def _compute_hourly(events: list[dict]) -> dict[str, dict[str, int]]:
@@ -1812,7 +1880,7 @@ def _compute_hourly_detail(events: list[dict]) -> dict[str, Any]:
             bucket["total"] += 1
 
         # Resolve staff display name
-        staff_email = (e.get("assigned_to") or "").strip().lower()
+        staff_email = e["assigned_to"]
         if e["event_type"] == "COMPLETED" and not _is_staff(staff_email):
             # Try msg_key lookup to find original assignee
             msg_key = e.get("msg_key") or ""
@@ -1820,7 +1888,7 @@ def _compute_hourly_detail(events: list[dict]) -> dict[str, Any]:
                 staff_email = assigned_staff.get(msg_key, staff_email)
             # Fall back to sender (COMPLETED rows often have staff as sender)
             if not _is_staff(staff_email):
-                sender_email = (e.get("sender") or "").strip().lower()
+                sender_email = e["sender"]
                 if _is_staff(sender_email):
                     staff_email = sender_email
         staff_name = _staff_display_name(staff_email) if _is_staff(staff_email) else staff_email
@@ -1846,16 +1914,29 @@ def _compute_hourly_detail(events: list[dict]) -> dict[str, Any]:
     }
 
 
-def _compute_distribution(events: list[dict], field: str,
-                          exclude: set | None = None) -> dict[str, int]:
-    counts: dict[str, int] = defaultdict(int)
-    exclude = exclude or set()
+def _compute_range_distributions(events: list[dict]) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+    """Risk-level, domain-bucket and staff-assignment counts in one pass.
+
+    Risk excludes heartbeat/blank, domain excludes blank, and assignments
+    count ASSIGNED-to-staff events by email. Each dict is ordered by count.
+    """
+    risk: dict[str, int] = defaultdict(int)
+    domain: dict[str, int] = defaultdict(int)
+    assigned: dict[str, int] = defaultdict(int)
     for e in events:
-        val = e.get(field, "") or ""
-        if val in exclude:
-            continue
-        counts[val] += 1
-    return dict(sorted(counts.items(), key=lambda x: -x[1]))
+        risk_level = e.get("risk_level", "") or ""
+        if risk_level and risk_level != "heartbeat":
+            risk[risk_level] += 1
+        bucket = e.get("domain_bucket", "") or ""
+        if bucket:
+            domain[bucket] += 1
+        if e["event_type"] == "ASSIGNED" and _is_staff(e["assigned_to"]):
+            assigned[e["assigned_to"]] += 1
+
+    def _by_count(counts: dict[str, int]) -> dict[str, int]:
+        return dict(sorted(counts.items(), key=lambda x: -x[1]))
+
+    return _by_count(risk), _by_count(domain), _by_count(assigned)
 
 
 def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: int = 50,
@@ -1864,77 +1945,56 @@ def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: in
                          activity_mode: str | None = None,
                          activity_staff: str | None = None) -> list[dict]:
     """Recent activity — most recent first."""
-    # Build lookup: msg_key → staff email from ASSIGNED events (all events, not just filtered)
-    # so COMPLETED rows can show who originally handled the ticket.
-    assigned_staff: dict[str, str] = {}
-    for e in all_events:
-        if e["event_type"] == "ASSIGNED" and _is_staff(e["assigned_to"]) and e["msg_key"]:
-            assigned_staff[e["msg_key"]] = e["assigned_to"]
-
     # ------------------------------------------------------------------
     # Duration inference for COMPLETED events (mirrors _compute_staff_kpis logic)
     # ------------------------------------------------------------------
 
-    def _resolve_ts(e: dict, kind: str) -> datetime | None:
-        """Best available timestamp for an event."""
-        if kind == "assigned":
-            ts = e.get("assigned_ts") or e.get("event_ts")
-        else:
-            ts = e.get("completed_ts") or e.get("event_ts")
-        if ts:
-            return ts
-        date_raw = e.get("date") or e.get("Date")
-        time_raw = e.get("time") or e.get("Time")
-        date_str = date_raw.strip() if isinstance(date_raw, str) else ""
-        time_str = time_raw.strip() if isinstance(time_raw, str) else ""
-        if not date_str or not time_str:
-            return None
-        return _parse_ts(f"{date_str}T{time_str}") or _parse_ts(f"{date_str} {time_str}")
-
     def _resolve_email(e: dict) -> str | None:
-        email = (e.get("assigned_to") or "").strip().lower()
+        email = e["assigned_to"]
         if _is_staff(email):
             return email
         if e["event_type"] == "COMPLETED":
-            sender = (e.get("sender") or e.get("Sender") or "").strip().lower()
+            sender = e["sender"]
             if _is_staff(sender):
                 return sender
         return None
 
-    # 1. msg_key → earliest ASSIGNED event_ts
+    # One pass over ASSIGNED events (all events, not just filtered) builds every
+    # lookup the feed joins against:
+    #   assigned_staff:       msg_key → staff email, so COMPLETED rows can show
+    #                         who originally handled the ticket
+    #   earliest_assigned_ts: group key → earliest ASSIGNED timestamp
+    #   staff_queues:         per-staff sorted ASSIGNED timestamps (for
+    #                         nearest-preceding matching)
+    assigned_staff: dict[str, str] = {}
     earliest_assigned_ts: dict[str, datetime] = {}
+    staff_queues: dict[str, list[datetime]] = defaultdict(list)
     for e in all_events:
         if e["event_type"] != "ASSIGNED":
             continue
-        key = _resolve_group_key(e)
-        if not key:
-            continue
-        ts = _resolve_ts(e, "assigned")
+        if e["msg_key"] and _is_staff(e["assigned_to"]):
+            assigned_staff[e["msg_key"]] = e["assigned_to"]
+        ts = _resolve_event_ts(e, "assigned")
         if not ts:
             continue
-        prev = earliest_assigned_ts.get(key)
-        if prev is None or ts < prev:
-            earliest_assigned_ts[key] = ts
-
-    # 2. Per-staff sorted lists of ASSIGNED timestamps (for nearest-preceding matching)
-    staff_queues: dict[str, list[datetime]] = defaultdict(list)
-    for e in all_events:
-        if e["event_type"] != "ASSIGNED":
-            continue
+        key = _resolve_group_key(e)
+        if key:
+            prev = earliest_assigned_ts.get(key)
+            if prev is None or ts < prev:
+                earliest_assigned_ts[key] = ts
         email = _resolve_email(e)
-        if not email:
-            continue
-        ts = _resolve_ts(e, "assigned")
-        if ts:
+        if email:
             staff_queues[email].append(ts)
     for q in staff_queues.values():
         q.sort()
 
     # Pre-consume queue with COMPLETED events that precede the filtered set,
     # so that today's completions don't match stale assignments.
-    filtered_set = set(_event_key(e) for e in filtered)
+    # filtered is a date-range subset of all_events, so object identity is
+    # enough to tell the two apart without building content-key tuples.
+    filtered_completed_ids = {id(e) for e in filtered if e["event_type"] == "COMPLETED"}
     for e in all_events:
-        if e["event_type"] != "COMPLETED" or _event_key(e) in filtered_set:
+        if e["event_type"] != "COMPLETED" or id(e) in filtered_completed_ids:
             continue
         email = _resolve_email(e)
         if not email:
@@ -1942,7 +2002,7 @@ def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: in
         key = _resolve_group_key(e)
         if key and earliest_assigned_ts.get(key):
             continue
-        completed_ts = _resolve_ts(e, "completed")
+        completed_ts = _resolve_event_ts(e, "completed")
         if completed_ts and staff_queues.get(email):
             _pop_nearest_preceding(staff_queues[email], completed_ts)
 
@@ -1956,7 +2016,7 @@ def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: in
     ]
     _completed_chrono.sort(key=lambda e: e.get("completed_ts") or e.get("event_ts") or datetime.min)
     for e in _completed_chrono:
-        completed_ts = _resolve_ts(e, "completed")
+        completed_ts = _resolve_event_ts(e, "completed")
         key = _resolve_group_key(e)
         assigned_ts = earliest_assigned_ts.get(key) if key else None
         email = _resolve_email(e)
@@ -1984,8 +2044,8 @@ def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: in
             key = _resolve_sami_group_key(e)
             if not key:
                 continue
-            event_type = (e.get("event_type") or "").strip().upper()
-            action = (e.get("action") or e.get("Action") or "").strip().upper()
+            event_type = e["event_type"]
+            action = e["action"]
             if event_type == "CONFIG_CHANGED":
                 continue
             if event_type not in ("ASSIGNED", "COMPLETED", "REASSIGN_MANUAL", "JIRA_FOLLOWUP_ASSIGNED"):
@@ -1994,11 +2054,11 @@ def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: in
             if event_type == "JIRA_FOLLOWUP_ASSIGNED" or action == "JIRA_FOLLOWUP":
                 job["is_jira_followup"] = True
             if event_type in ("ASSIGNED", "JIRA_FOLLOWUP_ASSIGNED") and job.get("initial_email") is None:
-                email = (e.get("assigned_to") or "").strip().lower()
+                email = e["assigned_to"]
                 if _is_staff(email):
                     job["initial_email"] = email
             if event_type in ("ASSIGNED", "REASSIGN_MANUAL", "JIRA_FOLLOWUP_ASSIGNED"):
-                email = (e.get("assigned_to") or "").strip().lower()
+                email = e["assigned_to"]
                 if _is_staff(email):
                     job["latest_email"] = email
                     job["latest_event_type"] = event_type
@@ -2029,7 +2089,7 @@ def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: in
             # Fall back to sender field (COMPLETED rows often have
             # the staff email as sender rather than assigned_to)
             if not _is_staff(staff):
-                sender = (e.get("sender") or e.get("Sender") or "").strip().lower()
+                sender = e["sender"]
                 if _is_staff(sender):
                     staff = sender
         return staff
@@ -2052,11 +2112,12 @@ def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: in
         feed_events = deduped_followups
     elif staff_filter:
         sf_lower = staff_filter.strip().lower()
-        feed_events = [
-            e for e in feed_events
-            if _staff_display_name(_display_staff(e)).lower() == sf_lower
-            or _display_staff(e).lower() == sf_lower
-        ]
+        staff_matched = []
+        for e in feed_events:
+            staff = _display_staff(e)
+            if staff.lower() == sf_lower or _staff_display_name(staff).lower() == sf_lower:
+                staff_matched.append(e)
+        feed_events = staff_matched
 
     result = []
     for e in feed_events[:limit]:
@@ -2072,7 +2133,7 @@ def _build_activity_feed(filtered: list[dict], all_events: list[dict], limit: in
             else:
                 dur_sec = _precomputed_dur.get(_event_key(e))
 
-        sender = (e.get("sender") or e.get("Sender") or "").strip().lower()
+        sender = e["sender"]
         result.append({
             "time": e["event_ts"].strftime("%H:%M:%S") if e["event_ts"] else "",
             "date": e["date"],
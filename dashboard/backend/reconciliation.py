@@ -17,32 +17,20 @@ Schema:
   }
 """
 
-import json
 import logging
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 
 from . import config
+from .data_reader import invalidate, json_dumps_pretty, load_json
 
 logger = logging.getLogger(__name__)
 
 _EMPTY_STATE: dict = {"version": 1, "reconciled": []}
 
 
-# ── Atomic I/O (mirrors server.py helpers) ──────────────────────────
-
-def _safe_load_json_direct(path: Path):
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f), None
-    except FileNotFoundError:
-        return None, f"Missing file: {path.name}"
-    except json.JSONDecodeError as e:
-        return None, f"Invalid JSON in {path.name}: {e}"
-    except OSError as e:
-        return None, f"Read failed for {path.name}: {e}"
-
+# ── Atomic write (mirrors server.py helper) ──────────────────────────
 
 def _atomic_write_json(path: Path, obj) -> tuple[bool, str | None]:
     """Atomic write (Windows-safe): write temp then os.replace()."""
@@ -50,10 +38,10 @@ def _atomic_write_json(path: Path, obj) -> tuple[bool, str | None]:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = path.with_name(path.name + f".tmp.{os.getpid()}")
-        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
-            json.dump(obj, f, indent=2)
-            f.write("\n")
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps_pretty(obj))
         os.replace(tmp_path, path)
+        invalidate(path)
         return True, None
     except Exception as e:
         try:
@@ -80,16 +68,21 @@ def _validate(data) -> bool:
 # ── Public API ───────────────────────────────────────────────────────
 
 def load_reconciled() -> dict:
-    """Load reconciled state. Returns empty state if missing or corrupt."""
-    data, err = _safe_load_json_direct(config.RECONCILED_JSON)
+    """Load reconciled state. Returns empty state if missing or corrupt.
+
+    Read through the mtime-keyed data_reader cache (every dashboard poll asks
+    for the reconciled set); callers get their own top-level dict and list.
+    """
+    if not config.RECONCILED_JSON.exists():
+        return {"version": 1, "reconciled": []}
+    data, err = load_json(config.RECONCILED_JSON)
     if err is not None:
-        if "Missing file" not in err:
-            logger.warning("Reconciled state load error: %s", err)
+        logger.warning("Reconciled state load error: %s", err)
         return {"version": 1, "reconciled": []}
     if not _validate(data):
         logger.warning("Reconciled state corrupt/invalid schema, returning empty")
         return {"version": 1, "reconciled": []}
-    return data
+    return {**data, "reconciled": list(data["reconciled"])}
 
 
 def load_reconciled_set() -> set[str]:
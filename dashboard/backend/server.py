@@ -1,5 +1,6 @@
 """FastAPI app — all endpoints + static file serving."""
 
+import asyncio
 import csv
 import io
 import json
@@ -8,19 +9,26 @@ import os
 import re
 import secrets
 import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from xml.sax.saxutils import escape
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
+from starlette.datastructures import Headers
+from starlette.requests import HTTPConnection
+from starlette.staticfiles import NotModifiedResponse
 
 from . import config
-from .data_reader import get_file_info, load_csv, load_json
+from .data_reader import get_file_info, invalidate, json_dumps_pretty, json_loads, load_csv, load_json, orjson
 from .kpi_engine import compute_dashboard, export_active_events, export_requestor_stats, export_staff_events
 from .reconciliation import load_reconciled, load_reconciled_set, add_reconciled, add_reconciled_bulk, remove_reconciled
 
@@ -71,8 +79,8 @@ def _dedupe_preserve_order(items: list[str]) -> list[str]:
 
 def _safe_load_json_direct(path: Path):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f), None
+        with open(path, "rb") as f:
+            return json_loads(f.read()), None
     except FileNotFoundError:
         return None, f"Missing file: {path.name}"
     except json.JSONDecodeError as e:
@@ -87,10 +95,10 @@ def _atomic_write_json(path: Path, obj) -> tuple[bool, str | None]:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = path.with_name(path.name + f".tmp.{os.getpid()}")
-        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
-            json.dump(obj, f, indent=2)
-            f.write("\n")
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps_pretty(obj))
         os.replace(tmp_path, path)
+        invalidate(path)
         return True, None
     except Exception as e:
         try:
@@ -879,8 +887,13 @@ def _validate_folders(raw) -> tuple[dict[str, str] | None, str | None]:
     return out, None
 
 
+# The canonical config loaders below read through data_reader's mtime/size
+# cache (invalidated by _atomic_write_json). They only inspect the parsed
+# object and return freshly built lists, so the shared cached value is never
+# mutated.
+
 def _load_staff_json() -> tuple[dict | None, str | None]:
-    data, err = _safe_load_json_direct(config.STAFF_JSON)
+    data, err = load_json(config.STAFF_JSON)
     if err:
         return None, err
     if not isinstance(data, dict):
@@ -903,7 +916,7 @@ def _load_staff_json() -> tuple[dict | None, str | None]:
 
 
 def _load_recipients_json(path: Path, *, name: str) -> tuple[dict | None, str | None]:
-    data, err = _safe_load_json_direct(path)
+    data, err = load_json(path)
     if err:
         return None, err
     if not isinstance(data, dict):
@@ -917,7 +930,7 @@ def _load_recipients_json(path: Path, *, name: str) -> tuple[dict | None, str |
 
 
 def _load_system_buckets_json() -> tuple[dict | None, str | None]:
-    data, err = _safe_load_json_direct(config.SYSTEM_BUCKETS_JSON)
+    data, err = load_json(config.SYSTEM_BUCKETS_JSON)
     if err:
         return None, err
     if not isinstance(data, dict):
@@ -997,8 +1010,8 @@ def _load_system_buckets_json() -> tuple[dict | None, str | None]:
 
 
 def _read_domain_policy_legacy() -> dict:
-    """Read domain_policy.json directly (bypass mtime cache). Read-only legacy fallback."""
-    data, _ = _safe_load_json_direct(config.DOMAIN_POLICY_JSON)
+    """Read domain_policy.json via the mtime cache. Read-only legacy fallback."""
+    data, _ = load_json(config.DOMAIN_POLICY_JSON)
     return data if isinstance(data, dict) else {}
 
 
@@ -1173,31 +1186,103 @@ def _save_domain_policy_payload(payload: dict) -> tuple[bool, str | None]:
 
 _sessions: set[str] = set()
 
-app = FastAPI(title="Transfer-Bot Dashboard API")
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed."""
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-    allow_credentials=True,
-)
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
-@app.middleware("http")
-async def auth_guard(request: Request, call_next):
-    path = request.url.path
-    if path == "/api/login" or not path.startswith("/api/"):
-        response = await call_next(request)
-    else:
-        token = request.cookies.get("session")
-        if not token or token not in _sessions:
-            return JSONResponse(status_code=401, content={"detail": "Not authenticated"})
-        response = await call_next(request)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+app = FastAPI(title="Transfer-Bot Dashboard API", default_response_class=FastJSONResponse)
+
+if config.ENABLE_CORS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+        allow_credentials=True,
+    )
+
+
+class AuthGuardMiddleware:
+    """Pure ASGI session check for ``/api/*`` (``/api/login`` excepted).
+
+    Only parses the cookie header for API paths; everything else is passed
+    straight through without building a Request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path != "/api/login" and path.startswith("/api/"):
+                token = HTTPConnection(scope).cookies.get("session")
+                if not token or token not in _sessions:
+                    response = JSONResponse(status_code=401, content={"detail": "Not authenticated"})
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(AuthGuardMiddleware)
+
+
+_NO_CACHE_HEADERS = [
+    (b"cache-control", b"no-cache, no-store, must-revalidate"),
+    (b"pragma", b"no-cache"),
+    (b"expires", b"0"),
+]
+
+
+class NoCacheMiddleware:
+    """Pure ASGI middleware that stamps no-cache headers on every HTTP response.
+
+    Avoids BaseHTTPMiddleware's per-request Request/Response wrapping; only
+    the ``http.response.start`` header list is touched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = [
+                    (k, v) for k, v in message.get("headers", [])
+                    if k.lower() not in (b"cache-control", b"pragma", b"expires")
+                ]
+                headers += _NO_CACHE_HEADERS
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# /api/dashboard payloads are large, highly compressible JSON polled by browsers.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+# Registered after AuthGuardMiddleware so it is the outer layer and also covers 401s.
+app.add_middleware(NoCacheMiddleware)
+
+
+# ── Request validation → 400 with a plain-string detail (what the UI shows) ──
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    errors = exc.errors()
+    detail = "Invalid request"
+    if errors:
+        first = errors[0]
+        cause = (first.get("ctx") or {}).get("error")
+        detail = str(cause) if cause else first.get("msg") or detail
+    return JSONResponse(status_code=400, content={"detail": detail})
 
 
 # ── Global exception handler ──
@@ -1246,7 +1331,31 @@ async def me():
 
 # ── Endpoints ──
 
-@app.get("/api/dashboard")
+def _load_dashboard_staff_list() -> list[str]:
+    # Prefer canonical staff.json; fall back to legacy staff.txt if missing/invalid.
+    staff_cfg, _ = _load_staff_json()
+    if staff_cfg:
+        return staff_cfg.get("staff", [])
+    staff_list = _load_list_from_legacy_txt(config.STAFF_TXT)
+    staff_list, _ = _normalize_list(staff_list, kind="email", field_name="staff_round_robin")
+    return staff_list or []
+
+
+@app.get("/api/dashboard", response_class=FastJSONResponse)
+async def dashboard_route(date_start: str | None = None, date_end: str | None = None,
+                          staff: str | None = None,
+                          activity_mode: str | None = None,
+                          activity_staff: str | None = None):
+    """Serve dashboard_endpoint's payload as orjson bytes directly.
+
+    Returning a Response skips FastAPI's recursive jsonable_encoder pass over
+    the (large) payload; orjson handles the datetimes/floats natively.
+    """
+    payload = await dashboard_endpoint(date_start=date_start, date_end=date_end, staff=staff,
+                                       activity_mode=activity_mode, activity_staff=activity_staff)
+    return FastJSONResponse(payload)
+
+
 async def dashboard_endpoint(date_start: str | None = None, date_end: str | None = None,
                              staff: str | None = None,
                              activity_mode: str | None = None,
@@ -1260,24 +1369,22 @@ async def dashboard_endpoint(date_start: str | None = None, date_end: str | None
         activity_mode: special recent-activity mode (optional)
         activity_staff: display name used by special recent-activity mode (optional)
     """
-    rows, csv_err = load_csv(_resolve_stats_csv_path())
-    roster, _ = load_json(config.ROSTER_STATE_JSON)
-    settings, _ = load_json(config.SETTINGS_OVERRIDES_JSON)
-    hib_state, _ = load_json(config.HIB_WATCHDOG_JSON)
-    # Prefer canonical staff.json; fall back to legacy staff.txt if missing/invalid.
-    staff_cfg, _ = _load_staff_json()
-    if staff_cfg:
-        staff_list = staff_cfg.get("staff", [])
-    else:
-        staff_list = _load_list_from_legacy_txt(config.STAFF_TXT)
-        staff_list, _ = _normalize_list(staff_list, kind="email", field_name="staff_round_robin")
-        staff_list = staff_list or []
-
-    rec_set = load_reconciled_set()
-    payload = compute_dashboard(rows, roster, settings, staff_list, hib_state,
-                                date_start=date_start, date_end=date_end,
-                                staff_filter=staff, reconciled_set=rec_set,
-                                activity_mode=activity_mode, activity_staff=activity_staff)
+    # Independent file loads run concurrently in worker threads; the KPI
+    # computation is offloaded too so a large CSV never blocks the event loop.
+    (rows, csv_err), (roster, _), (settings, _), (hib_state, _), staff_list, rec_set = await asyncio.gather(
+        asyncio.to_thread(load_csv, _resolve_stats_csv_path()),
+        asyncio.to_thread(load_json, config.ROSTER_STATE_JSON),
+        asyncio.to_thread(load_json, config.SETTINGS_OVERRIDES_JSON),
+        asyncio.to_thread(load_json, config.HIB_WATCHDOG_JSON),
+        asyncio.to_thread(_load_dashboard_staff_list),
+        asyncio.to_thread(load_reconciled_set),
+    )
+    payload = await asyncio.to_thread(
+        compute_dashboard, rows, roster, settings, staff_list, hib_state,
+        date_start=date_start, date_end=date_end,
+        staff_filter=staff, reconciled_set=rec_set,
+        activity_mode=activity_mode, activity_staff=activity_staff,
+    )
     warnings: list[str] = []
     if csv_err:
         warnings.append(csv_err)
@@ -1790,15 +1897,28 @@ async def get_staff():
     return {"staff": payload.get("staff_round_robin", [])}
 
 
+# Single-field address bodies: strip/lower-case in pydantic-core before the
+# field validators run, and ignore unknown keys from older clients.
+_ADDRESS_BODY_CONFIG = ConfigDict(str_strip_whitespace=True, str_to_lower=True, extra="ignore")
+
+
 class StaffRequest(BaseModel):
+    model_config = _ADDRESS_BODY_CONFIG
+
     email: str
 
+    @field_validator("email")
+    @classmethod
+    def _check_email(cls, v: str) -> str:
+        val, err = _normalize_email(v)
+        if err:
+            raise ValueError(err)
+        return val
+
 
 @app.post("/api/staff")
 async def post_staff(body: StaffRequest):
-    email, err = _normalize_email(body.email)
-    if err:
-        raise HTTPException(status_code=400, detail=err)
+    email = body.email
     payload = _build_domain_policy_payload()
     staff = payload.get("staff_round_robin", [])
     if email in staff:
@@ -1808,7 +1928,7 @@ async def post_staff(body: StaffRequest):
     ok, serr = _save_domain_policy_payload(payload)
     if not ok:
         raise HTTPException(status_code=400, detail=serr or "Failed to save config")
-    return {"message": f"Added: {email}", "staff": _build_domain_policy_payload().get("staff_round_robin", [])}
+    return {"message": f"Added: {email}", "staff": staff}
 
 
 @app.delete("/api/staff/{email}")
@@ -1825,7 +1945,7 @@ async def delete_staff(email: str):
     ok, serr = _save_domain_policy_payload(payload)
     if not ok:
         raise HTTPException(status_code=400, detail=serr or "Failed to save config")
-    return {"message": f"Removed: {email}", "staff": _build_domain_policy_payload().get("staff_round_robin", [])}
+    return {"message": f"Removed: {email}", "staff": staff}
 
 
 @app.get("/api/managers")
@@ -1836,9 +1956,7 @@ async def get_managers():
 
 @app.post("/api/managers")
 async def post_manager(body: StaffRequest):
-    email, err = _normalize_email(body.email)
-    if err:
-        raise HTTPException(status_code=400, detail=err)
+    email = body.email
     payload = _build_domain_policy_payload()
     managers = payload.get("manager_recipients", [])
     if email in managers:
@@ -1848,7 +1966,7 @@ async def post_manager(body: StaffRequest):
     ok, serr = _save_domain_policy_payload(payload)
     if not ok:
         raise HTTPException(status_code=400, detail=serr or "Failed to save config")
-    return {"message": f"Added: {email}", "managers": _build_domain_policy_payload().get("manager_recipients", [])}
+    return {"message": f"Added: {email}", "managers": managers}
 
 
 @app.delete("/api/managers/{email}")
@@ -1865,7 +1983,7 @@ async def delete_manager(email: str):
     ok, serr = _save_domain_policy_payload(payload)
     if not ok:
         raise HTTPException(status_code=400, detail=serr or "Failed to save config")
-    return {"message": f"Removed: {email}", "managers": _build_domain_policy_payload().get("manager_recipients", [])}
+    return {"message": f"Removed: {email}", "managers": managers}
 
 
 @app.get("/api/apps")
@@ -1876,9 +1994,7 @@ async def get_apps():
 
 @app.post("/api/apps")
 async def post_apps(body: StaffRequest):
-    email, err = _normalize_email(body.email)
-    if err:
-        raise HTTPException(status_code=400, detail=err)
+    email = body.email
     payload = _build_domain_policy_payload()
     apps = payload.get("apps_team_recipients", [])
     if email in apps:
@@ -1888,7 +2004,7 @@ async def post_apps(body: StaffRequest):
     ok, serr = _save_domain_policy_payload(payload)
     if not ok:
         raise HTTPException(status_code=400, detail=serr or "Failed to save config")
-    return {"message": f"Added: {email}", "apps": _build_domain_policy_payload().get("apps_team_recipients", [])}
+    return {"message": f"Added: {email}", "apps": apps}
 
 
 @app.delete("/api/apps/{email}")
@@ -1905,7 +2021,7 @@ async def delete_apps(email: str):
     ok, serr = _save_domain_policy_payload(payload)
     if not ok:
         raise HTTPException(status_code=400, detail=serr or "Failed to save config")
-    return {"message": f"Removed: {email}", "apps": _build_domain_policy_payload().get("apps_team_recipients", [])}
+    return {"message": f"Removed: {email}", "apps": apps}
 
 
 # ── Domain policy endpoints ──
@@ -1928,12 +2044,32 @@ _SENDER_BUCKETS = {
 
 
 class DomainRequest(BaseModel):
+    model_config = _ADDRESS_BODY_CONFIG
+
     domain: str
 
+    @field_validator("domain")
+    @classmethod
+    def _check_domain(cls, v: str) -> str:
+        val, err = _normalize_domain(v)
+        if err:
+            raise ValueError(err)
+        return val
+
 
 class SenderRequest(BaseModel):
+    model_config = _ADDRESS_BODY_CONFIG
+
     sender: str
 
+    @field_validator("sender")
+    @classmethod
+    def _check_sender(cls, v: str) -> str:
+        val, err = _normalize_email(v)
+        if err:
+            raise ValueError(err)
+        return val
+
 
 def _read_domain_policy() -> dict:
     """Legacy shim (read-only). Prefer canonical system_buckets.json via _build_domain_policy_payload()."""
@@ -1979,6 +2115,15 @@ def _validate_sender(sender: str) -> str:
     return val
 
 
+def _bucket_owner(payload: dict, buckets: dict[str, str], key: str, value: str) -> str | None:
+    """Return the bucket already holding *value* (own bucket first), or None."""
+    ordered = sorted(buckets.items(), key=lambda item: item[1] != key)
+    for bucket, bucket_key in ordered:
+        if value in payload.get(bucket_key, ()):
+            return bucket
+    return None
+
+
 @app.get("/api/domains/{bucket}")
 async def get_domains(bucket: str):
     key = _validate_bucket(bucket)
@@ -1989,23 +2134,19 @@ async def get_domains(bucket: str):
 @app.post("/api/domains/{bucket}")
 async def add_domain(bucket: str, body: DomainRequest):
     key = _validate_bucket(bucket)
-    domain = _validate_domain(body.domain)
+    domain = body.domain
     payload = _build_domain_policy_payload()
     domains = payload.get(key, [])
-    if domain in domains:
-        raise HTTPException(status_code=400, detail=f"{domain} already in {bucket}")
-    for other_bucket, other_key in _DOMAIN_BUCKETS.items():
-        if other_key == key:
-            continue
-        if domain in payload.get(other_key, []):
-            raise HTTPException(status_code=400, detail=f"{domain} already in {other_bucket}")
+    owner = _bucket_owner(payload, _DOMAIN_BUCKETS, key, domain)
+    if owner is not None:
+        raise HTTPException(status_code=400, detail=f"{domain} already in {owner}")
     domains.append(domain)
     payload[key] = domains
     ok, err = _save_domain_policy_payload(payload)
     if not ok:
         raise HTTPException(status_code=400, detail=err or "Failed to save config")
     logger.info("Added domain %s to %s", domain, bucket)
-    return {"domains": _build_domain_policy_payload().get(key, [])}
+    return {"domains": domains}
 
 
 @app.delete("/api/domains/{bucket}/{domain:path}")
@@ -2022,7 +2163,7 @@ async def remove_domain(bucket: str, domain: str):
     if not ok:
         raise HTTPException(status_code=400, detail=err or "Failed to save config")
     logger.info("Removed domain %s from %s", domain, bucket)
-    return {"domains": _build_domain_policy_payload().get(key, [])}
+    return {"domains": domains}
 
 
 # ── Sender override endpoints ──
@@ -2037,23 +2178,19 @@ async def get_senders(bucket: str):
 @app.post("/api/senders/{bucket}")
 async def add_sender(bucket: str, body: SenderRequest):
     key = _validate_sender_bucket(bucket)
-    sender = _validate_sender(body.sender)
+    sender = body.sender
     payload = _build_domain_policy_payload()
     senders = payload.get(key, [])
-    if sender in senders:
-        raise HTTPException(status_code=400, detail=f"{sender} already in {bucket}")
-    for other_bucket, other_key in _SENDER_BUCKETS.items():
-        if other_key == key:
-            continue
-        if sender in payload.get(other_key, []):
-            raise HTTPException(status_code=400, detail=f"{sender} already in {other_bucket}")
+    owner = _bucket_owner(payload, _SENDER_BUCKETS, key, sender)
+    if owner is not None:
+        raise HTTPException(status_code=400, detail=f"{sender} already in {owner}")
     senders.append(sender)
     payload[key] = senders
     ok, err = _save_domain_policy_payload(payload)
     if not ok:
         raise HTTPException(status_code=400, detail=err or "Failed to save config")
     logger.info("Added sender %s to %s", sender, bucket)
-    return {"senders": _build_domain_policy_payload().get(key, [])}
+    return {"senders": senders}
 
 
 @app.delete("/api/senders/{bucket}/{sender:path}")
@@ -2070,7 +2207,7 @@ async def remove_sender(bucket: str, sender: str):
     if not ok:
         raise HTTPException(status_code=400, detail=err or "Failed to save config")
     logger.info("Removed sender %s from %s", sender, bucket)
-    return {"senders": _build_domain_policy_payload().get(key, [])}
+    return {"senders": senders}
 
 
 @app.get("/api/health")
@@ -2100,6 +2237,8 @@ async def get_settings():
 
 
 class SettingUpdate(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     key: str
     value: str
 
@@ -2110,9 +2249,19 @@ async def update_setting(body: SettingUpdate):
     if body.key not in ["manager_cc_addr", "apps_cc_addr"]:
         raise HTTPException(status_code=400, detail="Invalid setting key")
 
-    # Validate email format
-    if body.value and "@" not in body.value:
-        raise HTTPException(status_code=400, detail="Invalid email format")
+    # Validate email format (";"-separated list, as accepted by the bot)
+    if body.value:
+        addresses = 0
+        for part in body.value.split(";"):
+            part = part.strip()
+            if not part:
+                # The bot drops empty parts too ("a@x.com;" is fine).
+                continue
+            if len(part) > 254 or part.count("@") != 1:
+                raise HTTPException(status_code=400, detail="Invalid email format")
+            addresses += 1
+        if not addresses:
+            raise HTTPException(status_code=400, detail="Invalid email format")
 
     # Load current settings (no cache)
     settings, _ = _safe_load_json_direct(config.SETTINGS_OVERRIDES_JSON)
@@ -2132,14 +2281,142 @@ async def update_setting(body: SettingUpdate):
 
 
 # ── Static files (frontend) — mounted last so API routes take priority ──
+_STATIC_STAT_TTL_SEC = 5.0
+_STATIC_STAT_CACHE_MAX = 256
+
+
+def _accepted_encodings(header: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into ``{coding: q}`` (lower-cased)."""
+    accepted: dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves ``<file>.br`` / ``<file>.gz`` siblings when present.
+
+    stat() results for files that exist are kept in a small LRU for a few
+    seconds so repeat asset hits skip the filesystem lookup; misses are never
+    cached, since the mount is reachable without a login. Files without a
+    precompressed sibling are served as usual (GZipMiddleware still
+    compresses them on the fly).
+    """
+
+    _ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stat_cache: OrderedDict[str, tuple[float, tuple[str, os.stat_result]]] = OrderedDict()
+        self._next_sweep = 0.0
+
+    def _cache_get(self, key: str, now: float):
+        if now >= self._next_sweep:
+            for stale in [k for k, (expires, _) in self._stat_cache.items() if expires <= now]:
+                del self._stat_cache[stale]
+            self._next_sweep = now + _STATIC_STAT_TTL_SEC
+        hit = self._stat_cache.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= now:
+            del self._stat_cache[key]
+            return None
+        self._stat_cache.move_to_end(key)
+        return hit[1]
+
+    def _cache_put(self, key: str, now: float, result: tuple[str, os.stat_result]) -> None:
+        self._stat_cache[key] = (now + _STATIC_STAT_TTL_SEC, result)
+        self._stat_cache.move_to_end(key)
+        while len(self._stat_cache) > _STATIC_STAT_CACHE_MAX:
+            self._stat_cache.popitem(last=False)
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        now = time.monotonic()
+        hit = self._cache_get(path, now)
+        if hit is not None:
+            return hit
+        result = super().lookup_path(path)
+        if result[1] is not None:
+            self._cache_put(path, now, result)
+        return result
+
+    def _sibling_stat(self, full_path: str) -> os.stat_result | None:
+        now = time.monotonic()
+        hit = self._cache_get(full_path, now)
+        if hit is not None:
+            return hit[1]
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return None
+        self._cache_put(full_path, now, (full_path, st))
+        return st
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        accept = ""
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        if accept:
+            accepted = _accepted_encodings(accept)
+            wildcard_q = accepted.get("*", 0.0)
+            candidates = [
+                (encoding, suffix)
+                for encoding, suffix in self._ENCODINGS
+                if accepted.get(encoding, wildcard_q) > 0
+            ]
+            # Highest q first; ties keep the br-before-gzip preference.
+            candidates.sort(key=lambda item: -accepted.get(item[0], wildcard_q))
+            for encoding, suffix in candidates:
+                compressed_path = f"{full_path}{suffix}"
+                compressed_stat = self._sibling_stat(compressed_path)
+                if compressed_stat is None:
+                    continue
+                original = FileResponse(full_path, stat_result=stat_result)
+                response = FileResponse(
+                    compressed_path,
+                    status_code=status_code,
+                    stat_result=compressed_stat,
+                    media_type=original.media_type,
+                    headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+                )
+                if self.is_not_modified(response.headers, Headers(scope=scope)):
+                    return NotModifiedResponse(response.headers)
+                return response
+        return super().file_response(full_path, stat_result, scope, status_code)
+
+
 FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
-app.mount("/", StaticFiles(directory=str(FRONTEND_DIR), html=True), name="frontend")
+app.mount("/", PrecompressedStaticFiles(directory=str(FRONTEND_DIR), html=True), name="frontend")
 
 
 def main():
     logger.info("Starting Transfer-Bot Dashboard on http://localhost:%s", config.PORT)
     logger.info("CSV path: %s", config.DAILY_STATS_CSV)
-    uvicorn.run(app, host=config.HOST, port=config.PORT, log_level="info")
+    # "auto" picks uvloop + httptools when uvicorn[standard] is installed and
+    # falls back to asyncio/h11 otherwise (uvloop has no Windows build).
+    uvicorn.run(
+        app,
+        host=config.HOST,
+        port=config.PORT,
+        loop="auto",
+        http="auto",
+        log_level="warning",
+        access_log=False,
+    )
 
 
 if __name__ == "__main__":
@@ -1,49 +1,41 @@
 """Read/write staff.txt — the ONLY file this dashboard writes to."""
 
 import logging
+import os
 import re
-import sys
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
-
-
-def _lock_file(f):
-    """Platform-aware file locking."""
-    if sys.platform == "win32":
-        import msvcrt
-        try:
-            # Lock a reasonably large byte range
-            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 4096)
-        except OSError:
-            # If locking fails, log but continue (file closing will release any locks)
-            logger.debug("File lock acquire failed (non-fatal)")
-    else:
-        import fcntl
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-
-
-def _unlock_file(f):
-    if sys.platform == "win32":
-        import msvcrt
-        try:
-            # Unlock the same byte range
-            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 4096)
-        except OSError:
-            # Unlock errors are non-fatal (file close releases locks anyway)
-            logger.debug("File lock release failed (non-fatal)")
-    else:
-        import fcntl
-        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")  # use fullmatch
+
+
+def _is_valid_email(email: str) -> bool:
+    # Cheap length/"@" checks reject most bad input before the regex runs.
+    return len(email) <= 254 and email.count("@") == 1 and EMAIL_RE.fullmatch(email) is not None
+
+
+# read_staff cache: str(path) -> ((st_mtime_ns, st_size), emails)
+_staff_cache: dict[str, tuple[tuple[int, int], list[str]]] = {}
+_staff_cache_lock = threading.Lock()
 
 
 def read_staff(path: Path) -> list[str]:
-    """Return list of staff emails from file."""
+    """Return list of staff emails from file (cached until mtime/size change)."""
+    key = str(path)
     try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _staff_cache_lock:
+            hit = _staff_cache.get(key)
+        if hit and hit[0] == stamp:
+            return list(hit[1])
         text = path.read_text(encoding="utf-8")
-        return [line.strip() for line in text.splitlines() if line.strip()]
+        emails = [line.strip() for line in text.splitlines() if line.strip()]
+        with _staff_cache_lock:
+            _staff_cache[key] = (stamp, emails)
+        return list(emails)
     except FileNotFoundError:
         logger.warning("staff.txt not found at %s", path)
         return []
@@ -53,44 +45,45 @@ def read_staff(path: Path) -> list[str]:
 
 
 def _write_staff(path: Path, emails: list[str]) -> None:
-    """Write staff list back to file with locking."""
-    content = "\n".join(emails) + "\n"
-    with open(path, "r+", encoding="utf-8") as f:
-        _lock_file(f)
-        try:
-            f.seek(0)
-            f.write(content)
-            f.truncate()
-        finally:
-            _unlock_file(f)
-
-
-def add_staff(path: Path, email: str) -> tuple[bool, str]:
-    """Add a staff email. Returns (success, message)."""
+    """Write staff list atomically (temp file + os.replace, Windows-safe)."""
+    tmp_path = path.with_name(path.name + f".tmp.{os.getpid()}")
+    try:
+        tmp_path.write_bytes(("\n".join(emails) + "\n").encode("utf-8"))
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        with _staff_cache_lock:
+            _staff_cache.pop(str(path), None)
+
+
+def add_staff(path: Path, email: str) -> tuple[bool, str, list[str]]:
+    """Add a staff email. Returns (success, message, current_list)."""
     email = email.strip().lower()
-    if not EMAIL_RE.match(email):
-        return False, f"Invalid email format: {email}"
+    if not _is_valid_email(email):
+        return False, f"Invalid email format: {email}", read_staff(path)
 
     current = read_staff(path)
-    if email in [e.lower() for e in current]:
-        return False, f"Already exists: {email}"
+    lower_set = {e.lower() for e in current}
+    if email in lower_set:
+        return False, f"Already exists: {email}", current
 
     current.append(email)
     _write_staff(path, current)
     logger.info("Added staff: %s", email)
-    return True, f"Added: {email}"
+    return True, f"Added: {email}", current
 
 
-def remove_staff(path: Path, email: str) -> tuple[bool, str]:
-    """Remove a staff email. Returns (success, message)."""
+def remove_staff(path: Path, email: str) -> tuple[bool, str, list[str]]:
+    """Remove a staff email. Returns (success, message, current_list)."""
     email = email.strip().lower()
     current = read_staff(path)
-    lower_map = {e.lower(): e for e in current}
-
-    if email not in lower_map:
-        return False, f"Not found: {email}"
+    target = {e.lower(): e for e in current}.get(email)
+    if target is None:
+        return False, f"Not found: {email}", current
 
-    current.remove(lower_map[email])
+    current.remove(target)
     _write_staff(path, current)
     logger.info("Removed staff: %s", email)
-    return True, f"Removed: {email}"
+    return True, f"Removed: {email}", current
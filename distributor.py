@@ -16,14 +16,17 @@ import time
 import json
 import csv
 import logging
-import schedule
 import atexit
-import subprocess
 import traceback
 import re
 import html
 import hashlib
-from logging.handlers import RotatingFileHandler
+import heapq
+import itertools
+import queue
+from collections import deque
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from urllib.parse import quote
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -36,6 +39,23 @@ except ImportError:
     OUTLOOK_AVAILABLE = False
     print("[WARN] pywin32 not available - running in demo mode")
 
+# Single-instance lock primitive: msvcrt on Windows, fcntl elsewhere
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Optional: faster JSON parsing and writing for state files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ==================== CONFIGURATION ====================
 CONFIG = {
     "mailbox": "Brian.Shaw@sa.gov.au",
@@ -185,7 +205,13 @@ def _get_file_logger():
             delay=True,
         )
         handler.setFormatter(logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s", "%Y-%m-%d %H:%M:%S"))
-        logger.addHandler(handler)
+        # Rotation checks and disk writes happen on the listener thread; log()
+        # only enqueues. stop() drains whatever is still queued at exit.
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
 
     _file_logger = logger
     return logger
@@ -203,6 +229,9 @@ def log_state_change(key, value, msg, level="INFO"):
 def log_once(key, msg, level="INFO"):
     return log_state_change(f"once:{key}", True, msg, level)
 
+# Same character set as str.isspace(), tested in one C-level scan.
+_re_any_whitespace = re.compile(r"\s")
+
 def is_valid_completion_cc(value):
     if not isinstance(value, str):
         return False
@@ -229,7 +258,7 @@ def is_valid_email(value):
     for part in parts:
         if not part:
             return False
-        if any(ch.isspace() for ch in part):
+        if _re_any_whitespace.search(part):
             return False
         if len(part) < 6 or len(part) > 254:
             return False
@@ -396,51 +425,47 @@ APPS_TEAM_NOTIFICATION_BANNER = (
 
 # ==================== HELPERS ====================
 def dedupe_preserve_order(items):
-    seen = set()
-    out = []
-    for item in items:
-        if not item:
-            continue
-        if item in seen:
-            continue
-        seen.add(item)
-        out.append(item)
-    return out
+    # dict keeps first-insertion order, so fromkeys dedupes in one C loop.
+    return list(dict.fromkeys(item for item in items if item))
 
 def build_critical_one_liner(orig_subject, sla_minutes, reasons):
     reasons_u = dedupe_preserve_order(reasons)
     reason_str = "; ".join(reasons_u) if reasons_u else "Unspecified"
     return f"CRITICAL | SLA {sla_minutes}m | {reason_str} | Subject: {orig_subject}"
 
-_re_assigned = re.compile(r"\[Assigned:\s*[^]]+\]", re.IGNORECASE)
-_re_critical = re.compile(r"\[CRITICAL\]", re.IGNORECASE)
+_re_bot_tags = re.compile(r"\[Assigned:\s*[^]]+\]|\[CRITICAL\]", re.IGNORECASE)
+_re_whitespace = re.compile(r"\s+")
 _re_sami_id = re.compile(r"\bSAMI-[A-Z0-9]+\b", re.IGNORECASE)
+_re_sami_tag = re.compile(r"\[sami-", re.IGNORECASE | re.ASCII)
+_re_completion_keyword = re.compile(re.escape(COMPLETION_SUBJECT_KEYWORD), re.IGNORECASE | re.ASCII)
 
 def strip_bot_subject_tags(subject):
     if not subject:
         return ""
     cleaned = subject
+    # One scan removes both tag kinds; repeat only while a removal exposed
+    # another tag (bounded as before).
     for _ in range(5):
-        cleaned = _re_assigned.sub("", cleaned)
-        cleaned = _re_critical.sub("", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        cleaned, removed = _re_bot_tags.subn("", cleaned)
+        if not removed:
+            break
+    cleaned = _re_whitespace.sub(" ", cleaned).strip()
     return cleaned
 
 def is_completion_subject(subject):
     if not subject:
         return False
-    return COMPLETION_SUBJECT_KEYWORD.lower() in str(subject).lower()
+    return _re_completion_keyword.search(str(subject)) is not None
+
+# Matched case-insensitively in place so long bodies are never lowercased.
+_re_jira_body = re.compile(r"atlassian|view request", re.IGNORECASE | re.ASCII)
 
 def is_jira_candidate(subject, body, sender):
-    subject_lower = (subject or "").lower()
-    body_lower = (body or "").lower()
-    sender_lower = (sender or "").lower()
-    return (
-        ("comment" in subject_lower)
-        or ("atlassian" in body_lower)
-        or ("view request" in body_lower)
-        or ("jira" in sender_lower)
-    )
+    if "comment" in (subject or "").lower():
+        return True
+    if _re_jira_body.search(body or ""):
+        return True
+    return "jira" in (sender or "").lower()
 
 def is_jira_comment_email(body):
     return "request comments:" in (body or "").lower()
@@ -483,15 +508,21 @@ def compute_sami_id(msg):
     if not seed:
         return ""
     try:
-        digest = hashlib.sha1(seed.encode("utf-8")).hexdigest().upper()
-        return f"SAMI-{digest[:6]}"
+        return _sami_id_for_seed(seed)
     except Exception:
         log("SAMI_ID_COMPUTE_FAIL", "WARN")
         return ""
 
+@lru_cache(maxsize=4096)
+def _sami_id_for_seed(seed):
+    # Each message is stamped, logged and archived under the same EntryID
+    # seed several times per tick; hash it once.
+    digest = hashlib.sha1(seed.encode("utf-8")).hexdigest().upper()
+    return f"SAMI-{digest[:6]}"
+
 def ensure_sami_id_in_subject(subject: str, msg) -> str:
     text = "" if subject is None else str(subject)
-    if "[sami-" in text.lower():
+    if _re_sami_tag.search(text):
         return text
     sami_id = compute_sami_id(msg)
     if not sami_id:
@@ -528,16 +559,19 @@ COMPLETION_MAILTO_URL_MAX_LEN = 1800
 COMPLETION_MAILTO_STRIP_SAFELINKS = True
 COMPLETION_MAILTO_STRIP_DISCLAIMER = True
 
+# <br>, <br/>, <br /> and the block-closing tags, matched in one scan.
+_re_html_line_breaks = re.compile(r"<br(?: ?/)?>|</(?:p|div|tr|li)>", re.IGNORECASE)
+_re_html_tag = re.compile(r"<[^>]+>")
+_re_blank_line_run = re.compile(r"\n{3,}")
+
 def _html_to_text_minimal(html_str):
     if not html_str:
         return ""
-    text = html_str
-    for tag in ("<br>", "<br/>", "<br />", "</p>", "</div>", "</tr>", "</li>"):
-        text = re.sub(re.escape(tag), "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _re_html_line_breaks.sub("\n", html_str)
+    text = _re_html_tag.sub("", text)
     text = html.unescape(text)
     text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _re_blank_line_run.sub("\n\n", text)
     return text.strip()
 
 def get_completion_source_body_text(msg):
@@ -557,45 +591,69 @@ def get_completion_source_body_text(msg):
         return html_text, "html"
     return "", "none"
 
+_COMPLETION_DISCLAIMER_MARKER = "this email and any attachments are confidential"
+# Matched against each lower-cased, stripped line: bare links, phone links and
+# (optionally) safelinks wrappers drop the whole line.
+_re_excerpt_drop_line = re.compile(r"^(?:https?://|tel:)|<tel:|safelinks\.protection\.outlook\.com")
+_re_excerpt_drop_line_keep_safelinks = re.compile(r"^(?:https?://|tel:)|<tel:")
+# More than two consecutive blank lines once joined.
+_re_excerpt_blank_excess = re.compile(r"(?:\r\n){4,}")
+
 def sanitize_completion_excerpt(text):
     if not text:
         return ""
     lines = text.splitlines()
-    out = []
-    blank_run = 0
-    for line in lines:
-        raw = line.strip()
-        lower = raw.lower()
-        if COMPLETION_MAILTO_STRIP_DISCLAIMER and "this email and any attachments are confidential" in lower:
-            break
-        if COMPLETION_MAILTO_STRIP_SAFELINKS and "safelinks.protection.outlook.com" in lower:
-            continue
-        if lower.startswith("http://") or lower.startswith("https://"):
-            continue
-        if "<tel:" in lower or lower.startswith("tel:"):
-            continue
-        if raw == "":
-            blank_run += 1
-            if blank_run > 2:
-                continue
-            out.append("")
-            continue
-        blank_run = 0
-        out.append(raw)
-    while out and out[0] == "":
-        out.pop(0)
-    while out and out[-1] == "":
-        out.pop()
-    return "\r\n".join(out)
+    # Lower-casing never adds or removes line breaks, so both splits align.
+    lowered = text.lower()
+    lower_lines = lowered.splitlines()
+    if COMPLETION_MAILTO_STRIP_DISCLAIMER and _COMPLETION_DISCLAIMER_MARKER in lowered:
+        cut = next(i for i, lower in enumerate(lower_lines) if _COMPLETION_DISCLAIMER_MARKER in lower)
+        lines = lines[:cut]
+    drop = _re_excerpt_drop_line if COMPLETION_MAILTO_STRIP_SAFELINKS else _re_excerpt_drop_line_keep_safelinks
+    kept = [line.strip() for line, lower in zip(lines, lower_lines) if not drop.search(lower.strip())]
+    return _re_excerpt_blank_excess.sub("\r\n\r\n\r\n", "\r\n".join(kept)).strip("\r\n")
+
+# Unicode string MAPI tags for the small header properties read together.
+_MAPI_STRING_PROPTAGS = {
+    "SenderName": "http://schemas.microsoft.com/mapi/proptag/0x0C1A001F",
+    "SenderEmailAddress": "http://schemas.microsoft.com/mapi/proptag/0x0C1F001F",
+    "Subject": "http://schemas.microsoft.com/mapi/proptag/0x0037001F",
+}
+
+def fetch_msg_fields(msg, *names):
+    """Read string properties *names* in one PropertyAccessor.GetProperties call.
+
+    Any field the batch cannot supply (no accessor, error code in the result,
+    unknown name) is read with getattr as before. Missing values become "".
+    """
+    values = {}
+    tagged = [name for name in names if name in _MAPI_STRING_PROPTAGS]
+    if tagged:
+        try:
+            batch = msg.PropertyAccessor.GetProperties([_MAPI_STRING_PROPTAGS[name] for name in tagged])
+            if isinstance(batch, (list, tuple)) and len(batch) == len(tagged):
+                for name, value in zip(tagged, batch):
+                    if isinstance(value, str):
+                        values[name] = value
+        except Exception:
+            pass
+    for name in names:
+        if name not in values:
+            try:
+                values[name] = getattr(msg, name, "") or ""
+            except Exception:
+                values[name] = ""
+    return values
 
 def build_completion_mailto_body(msg):
     """Build plain-text body for completion mailto with original email context."""
     if msg is None:
         return "", False
     try:
-        sender_name = getattr(msg, "SenderName", "") or ""
-        sender_email = resolve_sender_smtp(msg) or getattr(msg, "SenderEmailAddress", "") or ""
-        subject = getattr(msg, "Subject", "") or ""
+        fields = fetch_msg_fields(msg, "SenderName", "SenderEmailAddress", "Subject")
+        sender_name = fields["SenderName"]
+        sender_email = resolve_sender_smtp(msg) or fields["SenderEmailAddress"]
+        subject = fields["Subject"]
         try:
             received_time = msg.ReceivedTime
             received_str = received_time.strftime("%d %b %Y %H:%M") if received_time else ""
@@ -618,23 +676,35 @@ def build_completion_mailto_body(msg):
     except Exception:
         return "", False
 
+_URL_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~")
+
+def _quoted_prefix_lengths(text):
+    """Return lens where lens[k] == len(quote(text[:k], safe=''))."""
+    lens = [0]
+    total = 0
+    for ch in text:
+        total += 1 if ch in _URL_UNRESERVED else 3 * len(ch.encode("utf-8"))
+        lens.append(total)
+    return lens
+
+_re_sami_ref = re.compile(r"\bSAMI-\d+\b")
+# Mailbox is fixed; only the reference varies per call.
+_COMPLETION_FOOTER_WITH_MAILBOX = COMPLETION_FOOTER_TEMPLATE.format(mailbox=SAMI_SUPPORT_MAILBOX, ref="{ref}")
+
 def build_completion_mailto_url(to_email, cc_email, subject, body=None):
     to_value = str(to_email).strip() if to_email else ""
     if not to_value or "@" not in to_value:
         return ""
     cc_value = str(cc_email).strip() if cc_email else ""
     subject_value = "" if subject is None else str(subject)
-    if not subject_value.lstrip().lower().startswith(COMPLETION_SUBJECT_KEYWORD.lower()):
+    if not _re_completion_keyword.match(subject_value.lstrip()):
         subject_value = f"{COMPLETION_SUBJECT_PREFIX}{subject_value}".strip()
         log("COMPLETION_SUBJECT_PREFIXED added=1", "INFO")
     # Extract SAMI reference for completion footer
-    sami_match = re.search(r'\bSAMI-\d+\b', subject_value)
+    sami_match = _re_sami_ref.search(subject_value)
     sami_ref = sami_match.group(0) if sami_match else "the reference in the subject"
     # Build completion footer
-    completion_footer = COMPLETION_FOOTER_TEMPLATE.format(
-        mailbox=SAMI_SUPPORT_MAILBOX,
-        ref=sami_ref
-    )
+    completion_footer = _COMPLETION_FOOTER_WITH_MAILBOX.format(ref=sami_ref)
     # Append footer to body (or create body with footer if none exists)
     if not body:
         body = completion_footer
@@ -663,19 +733,28 @@ def build_completion_mailto_url(to_email, cc_email, subject, body=None):
             excerpt_part = "\r\n".join(lines[i + 1:])
             break
     trimmed = False
+    # quote() encodes character by character, so the encoded length of any
+    # excerpt prefix is a prefix sum; size each trim step from that and only
+    # encode the body once the final cut is known.
+    excerpt_prefix_len = _quoted_prefix_lengths(excerpt_part)
+    fixed_len = len(base_url) + len("&body=") + len(quote(header_part, safe=''))
+    url_len = len(full_url)
+    excerpt_len = len(excerpt_part)
     for _ in range(8):
-        if len(full_url) <= COMPLETION_MAILTO_URL_MAX_LEN:
+        if url_len <= COMPLETION_MAILTO_URL_MAX_LEN:
             break
-        if not excerpt_part:
+        if not excerpt_len:
             break
-        keep_len = int(len(excerpt_part) * 0.8)
-        if keep_len >= len(excerpt_part):
-            keep_len = max(0, len(excerpt_part) - 200)
-        excerpt_part = excerpt_part[:keep_len]
-        body = header_part + excerpt_part
+        keep_len = int(excerpt_len * 0.8)
+        if keep_len >= excerpt_len:
+            keep_len = max(0, excerpt_len - 200)
+        excerpt_len = keep_len
+        url_len = fixed_len + excerpt_prefix_len[excerpt_len]
+        trimmed = True
+    if trimmed:
+        body = header_part + excerpt_part[:excerpt_len]
         encoded_body = quote(body, safe='')
         full_url = base_url + "&body=" + encoded_body
-        trimmed = True
     if len(full_url) <= COMPLETION_MAILTO_URL_MAX_LEN:
         if trimmed:
             log(f"COMPLETION_MAILTO_TRIM url_len={len(full_url)} max={COMPLETION_MAILTO_URL_MAX_LEN} reason=url_too_long", "INFO")
@@ -730,7 +809,9 @@ def inject_completion_hotlink(fwd, original_sender_email, original_subject, sami
             use_html = True
     except Exception:
         pass
-    if fwd.HTMLBody:
+    # Only marshal HTMLBody for the emptiness test when BodyFormat did not
+    # already settle it; the prepend below reads it once either way.
+    if not use_html and fwd.HTMLBody:
         use_html = True
     if use_html:
         try:
@@ -754,10 +835,32 @@ def extract_subject_from_body(body_text):
         return match.group(1).strip()
     return ""
 
+# (EntryID, target) -> result, so repeat checks of one message skip the COM
+# CC/To/Recipients reads. Cleared wholesale when it grows past the cap.
+_completion_cc_cache = {}
+_COMPLETION_CC_CACHE_MAX = 2048
+
 def message_has_completion_cc(msg, target_addr):
     target = (target_addr or "").lower()
     if not target:
         return False
+    try:
+        entry_id = str(getattr(msg, "EntryID", "") or "")
+    except Exception:
+        entry_id = ""
+    if not entry_id:
+        return _message_has_completion_cc_uncached(msg, target)
+    cache_key = (entry_id, target)
+    cached = _completion_cc_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    result = _message_has_completion_cc_uncached(msg, target)
+    if len(_completion_cc_cache) >= _COMPLETION_CC_CACHE_MAX:
+        _completion_cc_cache.clear()
+    _completion_cc_cache[cache_key] = result
+    return result
+
+def _message_has_completion_cc_uncached(msg, target):
     try:
         cc_line = getattr(msg, "CC", "") or ""
         if target in cc_line.lower():
@@ -782,18 +885,48 @@ def message_has_completion_cc(msg, target_addr):
         pass
     return False
 
+# conversation_id -> first ledger key, rebuilt in one pass whenever the ledger
+# object or its size changes and dropped on every processed-ledger save.
+_ledger_conv_index = {"ledger": None, "size": -1, "index": {}}
+
+
+def _entry_conversation_id(entry):
+    if not isinstance(entry, dict):
+        return ""
+    cid = entry.get("conversation_id")
+    return "" if cid is None else str(cid).strip()
+
+
+def _invalidate_ledger_conv_index():
+    _ledger_conv_index["ledger"] = None
+    _ledger_conv_index["size"] = -1
+    _ledger_conv_index["index"] = {}
+
+
+def _ledger_conv_index_for(ledger):
+    if _ledger_conv_index["ledger"] is not ledger or _ledger_conv_index["size"] != len(ledger):
+        index = {}
+        for key, entry in ledger.items():
+            cid = _entry_conversation_id(entry)
+            if cid:
+                index.setdefault(cid, key)
+        _ledger_conv_index["ledger"] = ledger
+        _ledger_conv_index["size"] = len(ledger)
+        _ledger_conv_index["index"] = index
+    return _ledger_conv_index["index"]
+
+
 def find_ledger_key_by_conversation_id(ledger, conversation_id):
     ledger = ledger or {}
     conversation_id = "" if conversation_id is None else str(conversation_id).strip()
     if not conversation_id:
         return None
-    for key, entry in ledger.items():
-        if not isinstance(entry, dict):
-            continue
-        entry_cid = "" if entry.get("conversation_id") is None else str(entry.get("conversation_id")).strip()
-        if entry_cid == conversation_id:
-            return key
-    return None
+    key = _ledger_conv_index_for(ledger).get(conversation_id)
+    if key is None or _entry_conversation_id(ledger.get(key)) == conversation_id:
+        return key
+    # Entry rewritten in place since the index was built; rescan once.
+    _invalidate_ledger_conv_index()
+    return _ledger_conv_index_for(ledger).get(conversation_id)
 
 def extract_sami_id_from_subject(subject):
     text = "" if subject is None else str(subject)
@@ -987,23 +1120,45 @@ def _archive_assignment_recovery_anchor(msg, processed, sender_email, subject, r
     return archived_msg, archive_identity
 
 # ==================== LOGGING ====================
+# The stdout that _enable_safe_console() reconfigured, if any. Any other stream
+# (importers, tests, service wrappers) gets log()'s ASCII-sanitizing path.
+_safe_stdout = None
+
+def _enable_safe_console():
+    """Let the bot's console escape what it cannot encode instead of raising.
+
+    Only called from the __main__ entry point, so importing this module never
+    changes process-wide stdout settings.
+    """
+    global _safe_stdout
+    try:
+        sys.stdout.reconfigure(errors="backslashreplace")
+        _safe_stdout = sys.stdout
+    except Exception:
+        _safe_stdout = None
+
 def log(msg, level="INFO"):
     """Timestamped logging (encoding-safe for Windows console)"""
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     # ASCII-only symbols to prevent Windows console encoding crashes
     symbol = {"INFO": "[INFO]", "WARN": "[WARN]", "ERROR": "[ERROR]", "CRITICAL": "[CRIT]", "SUCCESS": "[OK]"}.get(level, "[LOG]")
-    # Sanitize message to ASCII to prevent encoding crashes
-    safe_msg = str(msg).encode("ascii", "backslashreplace").decode("ascii")
-    print(f"[{timestamp}] {symbol} {safe_msg}")
+    text = str(msg)
+    if sys.stdout is _safe_stdout:
+        print(f"[{timestamp}] {symbol} {text}")
+    else:
+        # Sanitize message to ASCII to prevent encoding crashes
+        safe_msg = text.encode("ascii", "backslashreplace").decode("ascii")
+        print(f"[{timestamp}] {symbol} {safe_msg}")
 
     # Also append to rotating log file (UTF-8 safe)
     try:
-        _get_file_logger().log(getattr(logging, level, logging.INFO), str(msg))
+        _get_file_logger().log(getattr(logging, level, logging.INFO), text)
     except Exception:
         pass
 
 
 _lock_acquired = False
+_lock_fd = None
 _last_heartbeat_ts = 0
 
 def maybe_emit_heartbeat(mailbox, inbox_folder, processed_folder):
@@ -1021,66 +1176,103 @@ def maybe_emit_heartbeat(mailbox, inbox_folder, processed_folder):
         )
         _last_heartbeat_ts = now_ts
 
+def _lock_fd_nonblocking(fd):
+    # Raises OSError when another process already holds the lock.
+    if msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    elif fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        raise OSError("no file locking primitive available")
+
 def acquire_lock():
-    # Acquire single-instance lock
-    global _lock_acquired
+    # Acquire single-instance lock. The OS drops it when the holding process
+    # exits, so a leftover bot.lock from a crash never blocks a restart.
+    global _lock_acquired, _lock_fd
+    fd = None
     try:
-        fd = os.open(LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-        with os.fdopen(fd, "w") as f:
-            f.write(f"{os.getpid()}\n")
+        fd = os.open(LOCK_PATH, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            _lock_fd_nonblocking(fd)
+        except OSError:
+            os.close(fd)
+            fd = None
+            log("LOCK_EXISTS_EXIT", "WARN")
+            try:
+                stat = os.stat(LOCK_PATH)
+                log(f"LOCK_FILE_PRESENT path={LOCK_PATH} mtime={stat.st_mtime} size={stat.st_size}", "WARN")
+            except Exception:
+                pass
+            log(f"INSTANCE_ALREADY_RUNNING lock_path={LOCK_PATH}", "WARN")
+            return False
+        pid_line = f"{os.getpid()}\n".encode("ascii")
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, pid_line)
+        os.ftruncate(fd, len(pid_line))
+        _lock_fd = fd
         _lock_acquired = True
         log("LOCK_ACQUIRED", "INFO")
         return True
-    except FileExistsError:
-        if sys.platform.startswith("win"):
-            if not is_bot_running_windows(os.path.abspath(".")):
-                try:
-                    os.remove(LOCK_PATH)
-                    log(f"LOCK_STALE_CLEARED path={LOCK_PATH}", "WARN")
-                    return acquire_lock()
-                except Exception:
-                    pass
-        log("LOCK_EXISTS_EXIT", "WARN")
-        try:
-            stat = os.stat(LOCK_PATH)
-            log(f"LOCK_FILE_PRESENT path={LOCK_PATH} mtime={stat.st_mtime} size={stat.st_size}", "WARN")
-        except Exception:
-            pass
-        log(f"INSTANCE_ALREADY_RUNNING lock_path={LOCK_PATH}", "WARN")
-        return False
     except Exception as e:
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
         log(f"Lock error for {LOCK_PATH}: {e}", "ERROR")
         return False
 
 def release_lock():
-    # Release single-instance lock best-effort
+    # Release single-instance lock best-effort. The file is left in place:
+    # unlinking it would let a second instance lock a fresh inode while a
+    # third still waits on this one.
+    global _lock_acquired, _lock_fd
     if not _lock_acquired:
         return
     try:
-        os.remove(LOCK_PATH)
+        if msvcrt is not None:
+            os.lseek(_lock_fd, 0, os.SEEK_SET)
+            msvcrt.locking(_lock_fd, msvcrt.LK_UNLCK, 1)
+        os.close(_lock_fd)
     except Exception as e:
         log(f"Lock release warning for {LOCK_PATH}: {e}", "WARN")
+    _lock_fd = None
+    _lock_acquired = False
 
-def is_bot_running_windows(repo_path):
-    # Best-effort process check for distributor.py in this repo path
+def _json_loads_bytes(raw):
+    # orjson parses bytes directly; stdlib json still handles what orjson
+    # rejects (NaN/Infinity from json.dumps, a UTF-8 BOM).
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+def _json_dumps_state(data):
+    # Datetimes/dataclasses are passed through to default=str so orjson writes
+    # them exactly as json.dumps did; anything it refuses (e.g. >64-bit ints)
+    # falls back to stdlib json, laid out the same way (2-space indent, UTF-8)
+    # so the file format does not depend on which path ran.
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            pass
+    text = json.dumps(data, indent=2, default=str, ensure_ascii=False)
     try:
-        result = subprocess.run(
-            ["wmic", "process", "where", "name='python.exe'", "get", "ProcessId,CommandLine"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            check=False
-        )
-        if result.returncode != 0:
-            return True
-        output = (result.stdout or "").lower()
-        repo_lower = repo_path.lower()
-        for line in output.splitlines():
-            if "distributor.py" in line and repo_lower in line:
-                return True
-        return False
-    except Exception:
-        return True
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be written as UTF-8; escape them instead.
+        return json.dumps(data, indent=2, default=str).encode("utf-8")
 
 def safe_load_json(path, default, *, required=False, state_name=""):
     # Load JSON with warning on missing/invalid
@@ -1088,21 +1280,29 @@ def safe_load_json(path, default, *, required=False, state_name=""):
         if not os.path.exists(path):
             log(f"STATE_MISSING state={state_name} path={path}", "WARN")
             return None if required else default
-        with open(path, 'r') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            return _json_loads_bytes(f.read())
     except Exception as e:
         log(f"STATE_CORRUPT state={state_name} path={path} error={e}", "WARN")
         return None if required else default
 
+# path -> (fingerprint after our last write, serialized payload). Lets a
+# tick that re-saves unchanged state skip the temp write + fsync + replace.
+_state_write_cache = {}
+
 def atomic_write_json(path, data, *, state_name=""):
     # Atomic JSON write via temp file + replace
     try:
+        payload = _json_dumps_state(data)
+        last = _state_write_cache.get(path)
+        if last is not None and last[1] == payload and last[0] == _file_fingerprint(path):
+            return True
         dir_name = os.path.dirname(path)
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
         tmp_path = f"{path}.tmp.{os.getpid()}"
-        with open(tmp_path, 'w') as f:
-            json.dump(data, f, indent=4, default=str)
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
         for attempt in range(3):
@@ -1113,6 +1313,9 @@ def atomic_write_json(path, data, *, state_name=""):
                 time.sleep(0.05 * (attempt + 1))
         else:
             raise PermissionError("replace_failed")
+        fp = _file_fingerprint(path)
+        if fp is not None:
+            _state_write_cache[path] = (fp, payload)
         return True
     except Exception as e:
         log(f"STATE_WRITE_FAIL state={state_name} path={path} error={e}", "ERROR")
@@ -1121,10 +1324,15 @@ def atomic_write_json(path, data, *, state_name=""):
 def normalize_email(raw):
     if not isinstance(raw, str):
         return None
+    return _normalize_email_str(raw)
+
+# Config reloads and sender checks see the same few addresses every tick.
+@lru_cache(maxsize=8192)
+def _normalize_email_str(raw):
     s = raw.strip().lower()
     if not s:
         return None
-    if any(ch.isspace() for ch in s):
+    if _re_any_whitespace.search(s):
         return None
     if s.count("@") != 1:
         return None
@@ -1135,9 +1343,18 @@ def normalize_email(raw):
         return None
     return s
 
+# Two or more dot-separated labels of alphanumerics (str.isalnum(), so IDN
+# labels pass) and hyphens. Labels cannot contain ".", so the match is
+# unambiguous and linear; whitespace, "/", "\\", "@" and ":" never match.
+_re_domain = re.compile(r"(?!.*_)[-\w]+(?:\.[-\w]+)+")
+
 def normalize_domain(raw):
     if not isinstance(raw, str):
         return None
+    return _normalize_domain_str(raw)
+
+@lru_cache(maxsize=8192)
+def _normalize_domain_str(raw):
     s = raw.strip().lower()
     if not s:
         return None
@@ -1148,37 +1365,45 @@ def normalize_domain(raw):
     elif s.startswith("https://"):
         s = s[len("https://"):]
     s = s.strip().rstrip("/")
-    if not s:
-        return None
-    if any(ch.isspace() for ch in s):
-        return None
-    if "/" in s or "\\" in s:
-        return None
-    if "@" in s:
-        return None
-    if ":" in s:
-        return None
-    if "." not in s:
-        return None
-    if s.startswith(".") or s.endswith(".") or ".." in s:
-        return None
-    for ch in s:
-        if ch.isalnum() or ch in ".-":
-            continue
+    if not _re_domain.fullmatch(s):
         return None
     return s
 
 def _dedupe_preserve_order(items):
-    seen = set()
-    out = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        out.append(item)
-    return out
+    return list(dict.fromkeys(items))
+
+# While load_config_files_each_tick runs, fingerprints come from one scandir
+# per directory instead of one stat per file (on Windows the listing already
+# carries mtime and size). None outside that window, so writers never see a
+# stale snapshot.
+_fingerprint_dir_snapshot = None
+
+def _snapshot_fingerprint(snapshot, path):
+    directory, name = os.path.split(path)
+    directory = directory or "."
+    dir_key = os.path.normcase(directory)
+    entries = snapshot.get(dir_key)
+    if entries is None:
+        entries = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    entries[os.path.normcase(entry.name)] = entry
+        except OSError:
+            pass
+        snapshot[dir_key] = entries
+    entry = entries.get(os.path.normcase(name))
+    if entry is None:
+        return None
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 def _file_fingerprint(path):
+    if _fingerprint_dir_snapshot is not None:
+        return _snapshot_fingerprint(_fingerprint_dir_snapshot, path)
     try:
         st = os.stat(path)
     except FileNotFoundError:
@@ -1190,6 +1415,36 @@ def _file_fingerprint(path):
         mtime_ns = int(st.st_mtime * 1_000_000_000)
     return (mtime_ns, st.st_size)
 
+_json_fp_cache = {}
+
+def _load_json_cached(path):
+    """json.load() *path*, reusing the last parse while its stat fingerprint is unchanged.
+
+    Raises like json.load on read/parse errors. Callers must not mutate the result.
+    """
+    fp = _file_fingerprint(path)
+    cached = _json_fp_cache.get(path)
+    if fp is not None and cached is not None and cached[0] == fp:
+        return cached[1]
+    with open(path, 'r', encoding="utf-8") as f:
+        obj = json.load(f)
+    if fp is not None:
+        _json_fp_cache[path] = (fp, obj)
+    return obj
+
+def _normalize_and_dedupe(items, normalizer, err):
+    """Normalize *items* in order, dropping repeats; (None, err) on the first invalid one."""
+    out = []
+    seen = set()
+    for item in items:
+        value = normalizer(item)
+        if not value:
+            return None, err
+        if value not in seen:
+            seen.add(value)
+            out.append(value)
+    return out, None
+
 def _parse_staff_json(obj):
     if not isinstance(obj, dict):
         return None, "staff.json must be a JSON object"
@@ -1198,29 +1453,15 @@ def _parse_staff_json(obj):
             return None, f"staff.json missing key: {key}"
         if not isinstance(obj.get(key), list):
             return None, f"staff.json key not a list: {key}"
-    staff = []
-    for item in obj.get("staff", []):
-        email = normalize_email(item)
-        if not email:
-            return None, "staff.json contains invalid email in staff"
-        staff.append(email)
-    off_rotation = []
-    for item in obj.get("off_rotation", []):
-        email = normalize_email(item)
-        if not email:
-            return None, "staff.json contains invalid email in off_rotation"
-        off_rotation.append(email)
-    leave = []
-    for item in obj.get("leave", []):
-        email = normalize_email(item)
-        if not email:
-            return None, "staff.json contains invalid email in leave"
-        leave.append(email)
-    return {
-        "staff": _dedupe_preserve_order(staff),
-        "off_rotation": _dedupe_preserve_order(off_rotation),
-        "leave": _dedupe_preserve_order(leave),
-    }, None
+    parsed = {}
+    for key in ("staff", "off_rotation", "leave"):
+        emails, err = _normalize_and_dedupe(
+            obj.get(key, []), normalize_email, f"staff.json contains invalid email in {key}"
+        )
+        if err:
+            return None, err
+        parsed[key] = emails
+    return parsed, None
 
 def _parse_recipients_json(obj, name="recipients"):
     if not isinstance(obj, dict):
@@ -1229,13 +1470,12 @@ def _parse_recipients_json(obj, name="recipients"):
         return None, f"{name}.json missing key: recipients"
     if not isinstance(obj.get("recipients"), list):
         return None, f"{name}.json key not a list: recipients"
-    recipients = []
-    for item in obj.get("recipients", []):
-        email = normalize_email(item)
-        if not email:
-            return None, f"{name}.json contains invalid email in recipients"
-        recipients.append(email)
-    return {"recipients": _dedupe_preserve_order(recipients)}, None
+    recipients, err = _normalize_and_dedupe(
+        obj.get("recipients", []), normalize_email, f"{name}.json contains invalid email in recipients"
+    )
+    if err:
+        return None, err
+    return {"recipients": recipients}, None
 
 def _parse_system_buckets_json(obj):
     if not isinstance(obj, dict):
@@ -1257,13 +1497,9 @@ def _parse_system_buckets_json(obj):
         return None, "system_buckets.json key not an object: folders"
 
     def _parse_domains(key):
-        domains = []
-        for item in obj.get(key, []):
-            dom = normalize_domain(item)
-            if not dom:
-                return None, f"system_buckets.json contains invalid domain in {key}"
-            domains.append(dom)
-        return _dedupe_preserve_order(domains), None
+        return _normalize_and_dedupe(
+            obj.get(key, []), normalize_domain, f"system_buckets.json contains invalid domain in {key}"
+        )
 
     transfer_domains, err = _parse_domains("transfer_domains")
     if err:
@@ -1288,13 +1524,7 @@ def _parse_system_buckets_json(obj):
             return [], None
         if not isinstance(raw, list):
             return None, f"system_buckets.json key not a list: {key}"
-        senders = []
-        for item in raw:
-            email = normalize_email(item)
-            if not email:
-                return None, f"system_buckets.json contains invalid email in {key}"
-            senders.append(email)
-        return _dedupe_preserve_order(senders), None
+        return _normalize_and_dedupe(raw, normalize_email, f"system_buckets.json contains invalid email in {key}")
 
     transfer_senders, err = _parse_senders("transfer_senders")
     if err:
@@ -1342,6 +1572,19 @@ def _parse_system_buckets_json(obj):
         "folders": folders,
     }, None
 
+def _stable_config_bytes(parsed):
+    # Canonical bytes for change detection; only compared within this process.
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(parsed, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    try:
+        stable = json.dumps(parsed, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    except Exception:
+        stable = repr(parsed)
+    return stable.encode("utf-8")
+
 def _reload_hot_json(name, path, parse_fn):
     state = _hot_config_state.get(name)
     if not isinstance(state, dict):
@@ -1350,6 +1593,8 @@ def _reload_hot_json(name, path, parse_fn):
     fp = _file_fingerprint(path)
     if fp is None:
         return state.get("lkg"), None
+    # Unchanged since the last look, valid or not: no read, parse or hash, and
+    # a CONFIG_INVALID is reported once per distinct file version.
     if state.get("seen_fp") == fp:
         return state.get("lkg"), None
 
@@ -1361,34 +1606,41 @@ def _reload_hot_json(name, path, parse_fn):
         state["seen_fp"] = fp
         return state.get("lkg"), {"event_type": "CONFIG_INVALID", "config_name": name, "error": f"read_failed:{type(e).__name__}"}
 
-    try:
-        text = raw.decode("utf-8")
-    except Exception:
+    obj = None
+    parsed_fast = False
+    if ORJSON_AVAILABLE:
         try:
-            text = raw.decode("utf-8-sig")
+            obj = orjson.loads(raw)
+            parsed_fast = True
+        except orjson.JSONDecodeError:
+            # Let the stdlib path below classify the failure (or accept
+            # what only json.loads does, e.g. NaN).
+            pass
+    if not parsed_fast:
+        try:
+            text = raw.decode("utf-8")
         except Exception:
-            state["seen_fp"] = fp
-            state["seen_sha"] = hashlib.sha256(raw).hexdigest()
-            return state.get("lkg"), {"event_type": "CONFIG_INVALID", "config_name": name, "error": "decode_failed"}
+            try:
+                text = raw.decode("utf-8-sig")
+            except Exception:
+                state["seen_fp"] = fp
+                state["seen_sha"] = None
+                return state.get("lkg"), {"event_type": "CONFIG_INVALID", "config_name": name, "error": "decode_failed"}
 
-    try:
-        obj = json.loads(text)
-    except Exception as e:
-        state["seen_fp"] = fp
-        state["seen_sha"] = hashlib.sha256(raw).hexdigest()
-        return state.get("lkg"), {"event_type": "CONFIG_INVALID", "config_name": name, "error": f"invalid_json:{type(e).__name__}"}
+        try:
+            obj = json.loads(text)
+        except Exception as e:
+            state["seen_fp"] = fp
+            state["seen_sha"] = None
+            return state.get("lkg"), {"event_type": "CONFIG_INVALID", "config_name": name, "error": f"invalid_json:{type(e).__name__}"}
 
     parsed, err = parse_fn(obj)
     if err:
         state["seen_fp"] = fp
-        state["seen_sha"] = hashlib.sha256(raw).hexdigest()
+        state["seen_sha"] = None
         return state.get("lkg"), {"event_type": "CONFIG_INVALID", "config_name": name, "error": err}
 
-    try:
-        stable = json.dumps(parsed, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-    except Exception:
-        stable = repr(parsed)
-    sha = hashlib.sha256(stable.encode("utf-8")).hexdigest()
+    sha = hashlib.sha256(_stable_config_bytes(parsed)).hexdigest()
 
     state["seen_fp"] = fp
     state["seen_sha"] = sha
@@ -1399,7 +1651,64 @@ def _reload_hot_json(name, path, parse_fn):
     state["lkg_sha"] = sha
     return parsed, {"event_type": "CONFIG_CHANGED", "config_name": name}
 
+# name -> (fingerprint, value) for the legacy fallback files, so ticks that
+# find them unchanged skip the read and re-parse. Missing files (no
+# fingerprint) are rebuilt every tick, as before.
+_fallback_cfg_cache = {}
+
+def _fingerprint_cached(name, path, build_fn):
+    fp = _file_fingerprint(path)
+    cached = _fallback_cfg_cache.get(name)
+    if fp is not None and cached is not None and cached[0] == fp:
+        return cached[1]
+    value = build_fn()
+    if fp is not None:
+        _fallback_cfg_cache[name] = (fp, value)
+    else:
+        _fallback_cfg_cache.pop(name, None)
+    return value
+
+def _recipients_from_txt(path):
+    recipients = []
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                s = line.strip()
+                if not s or s.startswith("#"):
+                    continue
+                email = normalize_email(s)
+                if email:
+                    recipients.append(email)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        pass
+    return {"recipients": _dedupe_preserve_order(recipients)}
+
+def _buckets_from_domain_policy():
+    fallback = safe_load_json(DOMAIN_POLICY_PATH, {}, required=False, state_name="domain_policy")
+    if not isinstance(fallback, dict):
+        fallback = {}
+    buckets_cfg = {
+        "transfer_domains": [normalize_domain(d) for d in fallback.get("external_image_request_domains", []) if normalize_domain(d)],
+        "system_notification_domains": [normalize_domain(d) for d in fallback.get("system_notification_domains", []) if normalize_domain(d)],
+        "quarantine_domains": [],
+        "held_domains": [normalize_domain(d) for d in fallback.get("always_hold_domains", []) if normalize_domain(d)],
+        "folders": {},
+    }
+    for k in ("transfer_domains", "system_notification_domains", "held_domains"):
+        buckets_cfg[k] = _dedupe_preserve_order(buckets_cfg[k])
+    return buckets_cfg
+
 def load_config_files_each_tick():
+    global _fingerprint_dir_snapshot
+    _fingerprint_dir_snapshot = {}
+    try:
+        return _load_config_files()
+    finally:
+        _fingerprint_dir_snapshot = None
+
+def _load_config_files():
     events = []
 
     staff_cfg, evt = _reload_hot_json("staff", STAFF_JSON_PATH, _parse_staff_json)
@@ -1416,20 +1725,7 @@ def load_config_files_each_tick():
     if evt:
         events.append(evt)
     if apps_cfg is None:
-        apps = []
-        if os.path.exists(APPS_TXT_PATH):
-            try:
-                with open(APPS_TXT_PATH, "r", encoding="utf-8", errors="replace") as f:
-                    for line in f:
-                        s = line.strip()
-                        if not s or s.startswith("#"):
-                            continue
-                        email = normalize_email(s)
-                        if email:
-                            apps.append(email)
-            except Exception:
-                pass
-        apps_cfg = {"recipients": _dedupe_preserve_order(apps)}
+        apps_cfg = _fingerprint_cached("apps_txt", APPS_TXT_PATH, lambda: _recipients_from_txt(APPS_TXT_PATH))
 
     mgr_cfg, evt = _reload_hot_json(
         "manager_config",
@@ -1439,38 +1735,14 @@ def load_config_files_each_tick():
     if evt:
         events.append(evt)
     if mgr_cfg is None:
-        mgrs = []
-        if os.path.exists(MANAGERS_TXT_PATH):
-            try:
-                with open(MANAGERS_TXT_PATH, "r", encoding="utf-8", errors="replace") as f:
-                    for line in f:
-                        s = line.strip()
-                        if not s or s.startswith("#"):
-                            continue
-                        email = normalize_email(s)
-                        if email:
-                            mgrs.append(email)
-            except Exception:
-                pass
-        mgr_cfg = {"recipients": _dedupe_preserve_order(mgrs)}
+        mgr_cfg = _fingerprint_cached("managers_txt", MANAGERS_TXT_PATH, lambda: _recipients_from_txt(MANAGERS_TXT_PATH))
 
     buckets_cfg, evt = _reload_hot_json("system_buckets", SYSTEM_BUCKETS_JSON_PATH, _parse_system_buckets_json)
     if evt:
         events.append(evt)
     if buckets_cfg is None:
         # Legacy fallback (bot-owned domain_policy.json). No CONFIG_CHANGED logs for legacy.
-        fallback = safe_load_json(DOMAIN_POLICY_PATH, {}, required=False, state_name="domain_policy")
-        if not isinstance(fallback, dict):
-            fallback = {}
-        buckets_cfg = {
-            "transfer_domains": [normalize_domain(d) for d in fallback.get("external_image_request_domains", []) if normalize_domain(d)],
-            "system_notification_domains": [normalize_domain(d) for d in fallback.get("system_notification_domains", []) if normalize_domain(d)],
-            "quarantine_domains": [],
-            "held_domains": [normalize_domain(d) for d in fallback.get("always_hold_domains", []) if normalize_domain(d)],
-            "folders": {},
-        }
-        for k in ("transfer_domains", "system_notification_domains", "held_domains"):
-            buckets_cfg[k] = _dedupe_preserve_order(buckets_cfg[k])
+        buckets_cfg = _fingerprint_cached("domain_policy", DOMAIN_POLICY_PATH, _buckets_from_domain_policy)
 
     return {
         "staff": staff_cfg,
@@ -1597,7 +1869,6 @@ def _get_normal_assignment_business_context(now_local=None):
 
 def _format_business_hours_skip_subject(subject):
     cleaned = strip_bot_subject_tags(subject or "")
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
     return cleaned[:120]
 
 def _resolve_mailitem_from_ledger_entry(namespace, entry):
@@ -1762,7 +2033,7 @@ def _forward_stale_reassign_in_place(msg, entry, assignee, staff_list, target_st
             requester = resolve_sender_smtp(msg) or getattr(msg, "SenderEmailAddress", "") or ""
         except Exception:
             requester = ""
-        staff_set = {s.lower() for s in (staff_list or []) if isinstance(s, str)}
+        staff_set = _staff_lookup_set(staff_list)
         if is_completion_subject(subject_with_id):
             skip_reason = "completion_email"
         elif assignee.lower() not in staff_set:
@@ -2180,18 +2451,15 @@ def process_manual_stale_requests():
     )
 
 def _add_and_resolve_recipients(mail, addrs, *, kind):
-    recips = mail.Recipients
-    added = 0
-    for a in (addrs or []):
-        if not isinstance(a, str):
-            continue
-        a2 = a.strip()
-        if not a2:
-            continue
-        recips.Add(a2)
-        added += 1
-    if added == 0:
+    # Filter in Python first so the COM loop below is just the Add calls.
+    cleaned = [a2 for a2 in (a.strip() for a in (addrs or []) if isinstance(a, str)) if a2]
+    if not cleaned:
         return True
+    recips = mail.Recipients
+    add_recipient = recips.Add
+    for a2 in cleaned:
+        add_recipient(a2)
+    added = len(cleaned)
     ok = True
     try:
         ok = bool(recips.ResolveAll())
@@ -2234,6 +2502,18 @@ def _send_hib_burst_alert(outlook_app, to_email, subject, body):
         log(f"HIB_BURST_ALERT_FAIL to={to_email} error={e}", "ERROR")
         return False
 
+# Every call re-reads the whole window from hib_watchdog.json; the stamps are
+# the same strings call after call, so each is parsed once. The file keeps
+# ISO strings because the dashboard reads them.
+@lru_cache(maxsize=1024)
+def _parse_hib_event_iso_str(ts):
+    return _parse_iso_safe(ts)
+
+def _parse_hib_event_iso(ts):
+    if not isinstance(ts, str):
+        return None
+    return _parse_hib_event_iso_str(ts)
+
 def hib_watchdog_record_and_maybe_alert(now_dt, outlook_app, manager_email, apps_email):
     try:
         state = safe_load_json(HIB_WATCHDOG_PATH, {}, required=False, state_name="hib_watchdog")
@@ -2248,7 +2528,7 @@ def hib_watchdog_record_and_maybe_alert(now_dt, outlook_app, manager_email, apps
         cutoff = now_dt - timedelta(minutes=HIB_BURST_WINDOW_MIN)
         trimmed = []
         for ts in hib_events:
-            parsed = _parse_iso_safe(ts)
+            parsed = _parse_hib_event_iso(ts)
             if parsed is not None and parsed >= cutoff:
                 trimmed.append(ts)
         hib_events = trimmed
@@ -2278,36 +2558,48 @@ def hib_watchdog_record_and_maybe_alert(now_dt, outlook_app, manager_email, apps
     except Exception as e:
         log(f"HIB_WATCHDOG_ERROR error={e}", "ERROR")
 
-def is_hib_notification(msg):
+# Case-insensitive in place (ASCII folding matches the old str.lower() tests
+# for these ASCII-only needles), so the 4KB body is never lowercased.
+_re_hib_to_cc = re.compile(re.escape("@chib.had.sa.gov.au"), re.IGNORECASE | re.ASCII)
+_re_hib_body = re.compile(re.escape("whib.had.sa.gov.au"), re.IGNORECASE | re.ASCII)
+_re_hib_error_body = re.compile(r"ensportal\.visualtrace|imgproduction", re.IGNORECASE | re.ASCII)
+_re_hib_error_subject = re.compile(r"error:", re.IGNORECASE | re.ASCII)
+
+def _read_hib_body(msg):
+    try:
+        return (getattr(msg, "Body", "") or "")[:4000]
+    except Exception:
+        return ""
+
+def is_hib_notification(msg, body=None):
+    # To and CC are checked separately (the needle has no space, so it can
+    # never straddle the old "To CC" join); a To hit skips the CC read.
     try:
         to_line = getattr(msg, "To", "") or ""
     except Exception:
         to_line = ""
+    if _re_hib_to_cc.search(to_line):
+        return True
     try:
         cc_line = getattr(msg, "CC", "") or ""
     except Exception:
         cc_line = ""
-    to_cc = (to_line + " " + cc_line).lower()
-    if "@chib.had.sa.gov.au" in to_cc:
+    if _re_hib_to_cc.search(cc_line):
         return True
-    try:
-        body = (getattr(msg, "Body", "") or "")[:4000]
-    except Exception:
-        body = ""
-    body_lower = body.lower()
-    if "whib.had.sa.gov.au" in body_lower:
+    if body is None:
+        body = _read_hib_body(msg)
+    if _re_hib_body.search(body):
         return True
     try:
         subject = getattr(msg, "Subject", "") or ""
     except Exception:
         subject = ""
-    subject_lower = subject.lower()
-    if subject_lower.startswith("error:"):
-        if ("ensportal.visualtrace" in body_lower) or ("imgproduction" in body_lower):
+    if _re_hib_error_subject.match(subject):
+        if _re_hib_error_body.search(body):
             return True
     return False
 
-def hib_contains_16110(msg):
+def hib_contains_16110(msg, body=None):
     """Check if HIB message contains '16110' in subject or body (best-effort)"""
     try:
         subject = getattr(msg, "Subject", "") or ""
@@ -2315,15 +2607,13 @@ def hib_contains_16110(msg):
         subject = ""
     if "16110" in subject:
         return True
-    try:
-        body = (getattr(msg, "Body", "") or "")[:4000]
-    except Exception:
-        body = ""
+    if body is None:
+        body = _read_hib_body(msg)
     if "16110" in body:
         return True
     return False
 
-def hib_contains_16111(msg):
+def hib_contains_16111(msg, body=None):
     """Check if HIB message contains '16111' in subject or body (best-effort)"""
     try:
         subject = getattr(msg, "Subject", "") or ""
@@ -2331,10 +2621,8 @@ def hib_contains_16111(msg):
         subject = ""
     if "16111" in subject:
         return True
-    try:
-        body = (getattr(msg, "Body", "") or "")[:4000]
-    except Exception:
-        body = ""
+    if body is None:
+        body = _read_hib_body(msg)
     if "16111" in body:
         return True
     return False
@@ -2352,8 +2640,7 @@ def get_staff_list():
     try:
         json_path = os.path.abspath(STAFF_JSON_PATH)
         if os.path.exists(json_path):
-            with open(json_path, 'r', encoding="utf-8") as f:
-                scfg = json.load(f)
+            scfg = _load_json_cached(json_path)
             if isinstance(scfg, dict) and isinstance(scfg.get("staff"), list) and scfg["staff"]:
                 all_staff = [e.strip().lower() for e in scfg["staff"] if e.strip()]
                 off = set((e.strip().lower() for e in (scfg.get("off_rotation") or [])))
@@ -2393,13 +2680,23 @@ def get_staff_list():
         log(f"STAFF_FILE_ERROR path={STAFF_PATH} error={e}", "ERROR")
         return []
 
+@lru_cache(maxsize=1)
 def _get_known_staff_for_stale_reloop():
     """Return legitimate stale-reloop assignees regardless of rotation status."""
-    return {
+    # Built from a module constant, so normalise it once per process.
+    return frozenset(
         email
         for email in (normalize_email(item) for item in STALE_RELOOP_KNOWN_STAFF_ALLOWLIST)
         if email
-    }
+    )
+
+@lru_cache(maxsize=8)
+def _staff_set_for(staff_tuple):
+    return frozenset(s.lower() for s in staff_tuple if isinstance(s, str))
+
+def _staff_lookup_set(staff_list):
+    """Lowercased staff membership set, shared across messages for the same roster."""
+    return _staff_set_for(tuple(staff_list or ()))
 
 def find_child_folder(parent_folder, child_name):
     """Return child folder by name or None"""
@@ -2473,16 +2770,20 @@ def resolve_folder_by_path(root, path_spec):
 
 def resolve_folder_recursive(root, target_name, max_depth=6, max_nodes=2500):
     """Resolve a folder by name using deterministic BFS"""
+    try:
+        target_lower = target_name.lower().strip()
+    except Exception:
+        target_lower = None
     try:
         root_name = (root.Name or "").strip()
-        if root_name.lower() == target_name.lower().strip():
+        if root_name.lower() == target_lower:
             return root
     except Exception:
         pass
-    queue = [(root, 0)]
+    pending = deque([(root, 0)])
     visited = 0
-    while queue:
-        node, depth = queue.pop(0)
+    while pending:
+        node, depth = pending.popleft()
         if depth >= max_depth:
             continue
         try:
@@ -2499,11 +2800,11 @@ def resolve_folder_recursive(root, target_name, max_depth=6, max_nodes=2500):
                 continue
             try:
                 child_name = (child.Name or "").strip()
-                if child_name.lower() == target_name.lower().strip():
+                if child_name.lower() == target_lower:
                     return child
             except Exception:
                 pass
-            queue.append((child, depth + 1))
+            pending.append((child, depth + 1))
     return None
 
 def resolve_folder(root, folder_spec):
@@ -2515,6 +2816,15 @@ def resolve_folder(root, folder_spec):
 def get_or_create_subfolder(parent_folder, name):
     if not parent_folder or not name:
         return None
+    # Folders.Item(name) is one COM lookup instead of reading every child's
+    # Name; it matches case-insensitively, so confirm the exact name before
+    # trusting it and fall back to the enumeration otherwise.
+    try:
+        folder = parent_folder.Folders.Item(name)
+        if folder is not None and folder.Name == name:
+            return folder
+    except Exception:
+        pass
     try:
         for folder in parent_folder.Folders:
             try:
@@ -2631,35 +2941,49 @@ def load_domain_policy(path=None):
     log_state_change("policy_loaded_path", path, f"POLICY_LOADED path={path}", "INFO")
     return policy, True
 
+_KNOWN_DOMAIN_KEYS = (
+    "internal_domains",
+    "external_image_request_domains",
+    "system_notification_domains",
+    "quarantine_domains",
+    "always_hold_domains",
+    "vendor_domains"
+)
+# The policy dict is re-read every tick, so cache on the contents of its
+# domain lists: comparing the snapshot tuples is far cheaper than re-lowering
+# every domain when the policy has not changed.
+_known_domains_cache = {"key": None, "domains": frozenset()}
+
 def get_known_domains(policy):
     if not isinstance(policy, dict):
         return set()
-    domains = []
-    for key in (
-        "internal_domains",
-        "external_image_request_domains",
-        "system_notification_domains",
-        "quarantine_domains",
-        "always_hold_domains",
-        "vendor_domains"
-    ):
+    sources = []
+    for key in _KNOWN_DOMAIN_KEYS:
         value = policy.get(key, [])
-        if isinstance(value, list):
-            domains.extend(value)
-    return {d.lower().strip() for d in domains if isinstance(d, str) and d.strip()}
+        sources.append(tuple(value) if isinstance(value, list) else ())
+    sources = tuple(sources)
+    if _known_domains_cache["key"] != sources:
+        _known_domains_cache["domains"] = frozenset(
+            d.lower().strip() for value in sources for d in value if isinstance(d, str) and d.strip()
+        )
+        _known_domains_cache["key"] = sources
+    return set(_known_domains_cache["domains"])
+
+# Text after the first "<" up to the next ">" (or end of string), matching the
+# old split("<")/split(">") extraction for "Name <user@host>" senders.
+_re_angle_addr = re.compile(r"<([^>]*)")
 
 def is_domain_known(sender_email, known_domains):
     if not sender_email or not isinstance(known_domains, set) or not known_domains:
         return False
     email_str = str(sender_email).strip()
-    if "<" in email_str and ">" in email_str:
-        try:
-            email_str = email_str.split("<", 1)[1].split(">", 1)[0].strip()
-        except Exception:
-            return False
+    if ">" in email_str:
+        match = _re_angle_addr.search(email_str)
+        if match:
+            email_str = match.group(1).strip()
     if "@" not in email_str:
         return False
-    domain = email_str.split("@")[-1].strip().lower()
+    domain = email_str.rpartition("@")[2].strip().lower()
     if not domain:
         return False
     return domain in known_domains
@@ -2681,17 +3005,18 @@ def classify_sender(sender_email, sender_domain, policy):
     email_lower = normalize_sender_for_policy(sender_email) or ""
     domain_lower = sender_domain.lower().strip() if sender_domain else ""
 
-    # Build sets for O(1) membership (lists stored in JSON, sets built at runtime)
-    q_senders = _build_sender_override_set(policy, "quarantine_senders")
-    q_domains = set(d.lower().strip() for d in policy.get("quarantine_domains", []))
-    h_senders = _build_sender_override_set(policy, "held_senders")
-    h_domains = set(d.lower().strip() for d in policy.get("held_domains", []))
-    sn_senders = _build_sender_override_set(policy, "system_notification_senders")
-    sn_domains = set(d.lower().strip() for d in policy.get("system_notification_domains", []))
-    eir_senders = _build_sender_override_set(policy, "transfer_senders")
-    eir_domains = set(d.lower().strip() for d in policy.get("transfer_domains", []))
-    ad_senders = _build_sender_override_set(policy, "applications_direct_senders")
-    ad_domains = set(d.lower().strip() for d in policy.get("applications_direct_domains", []))
+    # Sets for O(1) membership (lists stored in JSON, sets built once per policy)
+    policy_sets = _policy_match_sets(policy)
+    q_senders = policy_sets["quarantine_senders"]
+    q_domains = policy_sets["quarantine_domains"]
+    h_senders = policy_sets["held_senders"]
+    h_domains = policy_sets["held_domains"]
+    sn_senders = policy_sets["system_notification_senders"]
+    sn_domains = policy_sets["system_notification_domains"]
+    eir_senders = policy_sets["transfer_senders"]
+    eir_domains = policy_sets["transfer_domains"]
+    ad_senders = policy_sets["applications_direct_senders"]
+    ad_domains = policy_sets["applications_direct_domains"]
 
     # 1. Quarantine
     if email_lower and email_lower in q_senders:
@@ -2729,6 +3054,9 @@ def classify_sender(sender_email, sender_domain, policy):
 
 
 
+_re_bracketed_addr = re.compile(r"<([^>]+)>")
+_re_embedded_email = re.compile(r"[a-z0-9._%+\-]+@[a-z0-9.\-]+\.[a-z]{2,}")
+
 def normalize_sender_for_policy(raw):
     """Normalize sender strings for exact override matching."""
     if not isinstance(raw, str):
@@ -2738,11 +3066,12 @@ def normalize_sender_for_policy(raw):
         return None
     if s.startswith("smtp:"):
         s = s[5:].strip()
-    match = re.search(r"<([^>]+)>", s)
-    if match:
-        s = match.group(1).strip()
+    if "<" in s:
+        match = _re_bracketed_addr.search(s)
+        if match:
+            s = match.group(1).strip()
     if "@" not in s:
-        fallback = re.search(r"[a-z0-9._%+\-]+@[a-z0-9.\-]+\.[a-z]{2,}", s)
+        fallback = _re_embedded_email.search(s)
         if fallback:
             s = fallback.group(0).strip()
     return normalize_email(s)
@@ -2760,23 +3089,82 @@ def _build_sender_override_set(policy, key):
     return result
 
 
+_POLICY_SENDER_KEYS = (
+    "quarantine_senders",
+    "held_senders",
+    "system_notification_senders",
+    "transfer_senders",
+    "applications_direct_senders",
+)
+_POLICY_DOMAIN_KEYS = (
+    "quarantine_domains",
+    "held_domains",
+    "system_notification_domains",
+    "transfer_domains",
+    "applications_direct_domains",
+)
+# Single entry keyed on the source lists themselves (held so their ids cannot
+# be reused) plus their lengths; empty lists match any empty list. The policy
+# dict is rebuilt every tick, but these lists come straight from the hot
+# system_buckets config, which hands back the same objects until the file
+# changes, so the sets survive across ticks.
+_policy_sets_cache = {"sources": None, "key": None, "sets": None}
+
+def _policy_match_sets(policy):
+    sources = tuple(policy.get(k) if isinstance(policy, dict) else None for k in _POLICY_SENDER_KEYS + _POLICY_DOMAIN_KEYS)
+    key = tuple(len(v) if isinstance(v, (list, tuple, set, frozenset, dict)) else -1 for v in sources)
+    cached_sources = _policy_sets_cache["sources"]
+    if (
+        cached_sources is not None
+        and _policy_sets_cache["key"] == key
+        and all(a is b or n == 0 for a, b, n in zip(cached_sources, sources, key))
+    ):
+        return _policy_sets_cache["sets"]
+    sets = {k: frozenset(_build_sender_override_set(policy, k)) for k in _POLICY_SENDER_KEYS}
+    for k in _POLICY_DOMAIN_KEYS:
+        domains = policy.get(k, []) if isinstance(policy, dict) else []
+        sets[k] = frozenset(d.lower().strip() for d in domains)
+    _policy_sets_cache["sources"] = sources
+    _policy_sets_cache["key"] = key
+    _policy_sets_cache["sets"] = sets
+    return sets
+
 def get_sender_override_bucket(sender_email, policy):
     """Return sender override bucket for this sender, or None if no override."""
     email_lower = normalize_sender_for_policy(sender_email)
     if not email_lower:
         return None
-    if email_lower in _build_sender_override_set(policy, "quarantine_senders"):
+    policy_sets = _policy_match_sets(policy)
+    if email_lower in policy_sets["quarantine_senders"]:
         return "quarantine"
-    if email_lower in _build_sender_override_set(policy, "held_senders"):
+    if email_lower in policy_sets["held_senders"]:
         return "hold"
-    if email_lower in _build_sender_override_set(policy, "system_notification_senders"):
+    if email_lower in policy_sets["system_notification_senders"]:
         return "system_notification"
-    if email_lower in _build_sender_override_set(policy, "transfer_senders"):
+    if email_lower in policy_sets["transfer_senders"]:
         return "external_image_request"
-    if email_lower in _build_sender_override_set(policy, "applications_direct_senders"):
+    if email_lower in policy_sets["applications_direct_senders"]:
         return "applications_direct"
     return None
 
+# Per-key lowered/stripped policy sets for classify_sender_domain() and
+# is_sami_support_staff(), built lazily so a malformed list only raises when it
+# is actually consulted (as before). Like _policy_match_sets, entries are keyed
+# on the source list itself (held so its id cannot be reused) and its length,
+# so lists handed over unchanged from the hot system_buckets config keep their
+# sets across ticks.
+_policy_normalized_sets_cache = {}
+
+def _policy_normalized_set(policy, key):
+    values = policy.get(key, [])
+    size = len(values) if isinstance(values, (list, tuple, set, frozenset, dict)) else -1
+    cached = _policy_normalized_sets_cache.get(key)
+    if cached is not None and cached[1] == size and (cached[0] is values or size == 0):
+        return cached[2]
+    normalized = frozenset(d.lower().strip() for d in values)
+    _policy_normalized_sets_cache[key] = (values, size, normalized)
+    return normalized
+
 # Superseded by classify_sender() for process_inbox routing — kept for backward compatibility.
 def classify_sender_domain(domain, policy):
     """
@@ -2790,28 +3178,23 @@ def classify_sender_domain(domain, policy):
     domain_lower = domain.lower().strip()
 
     # Check quarantine domains (must run before any assignment/routing)
-    quarantine_domains = [d.lower().strip() for d in policy.get("quarantine_domains", [])]
-    if domain_lower in quarantine_domains:
+    if domain_lower in _policy_normalized_set(policy, "quarantine_domains"):
         return "quarantine"
 
     # Check always hold domains (held overrides system_notification)
-    hold_domains = [d.lower().strip() for d in policy.get("always_hold_domains", [])]
-    if domain_lower in hold_domains:
+    if domain_lower in _policy_normalized_set(policy, "always_hold_domains"):
         return "hold"
 
     # Check system notification domains (Class 3)
-    system_notification_domains = [d.lower().strip() for d in policy.get("system_notification_domains", [])]
-    if domain_lower in system_notification_domains:
+    if domain_lower in _policy_normalized_set(policy, "system_notification_domains"):
         return "system_notification"
 
     # Check external image request domains (Class 1)
-    external_image_domains = [d.lower().strip() for d in policy.get("external_image_request_domains", [])]
-    if domain_lower in external_image_domains:
+    if domain_lower in _policy_normalized_set(policy, "external_image_request_domains"):
         return "external_image_request"
 
     # Check internal domains
-    internal_domains = [d.lower().strip() for d in policy.get("internal_domains", [])]
-    if domain_lower in internal_domains:
+    if domain_lower in _policy_normalized_set(policy, "internal_domains"):
         return "internal"
 
     # Unknown domain
@@ -2826,9 +3209,7 @@ def is_sami_support_staff(sender_email, policy):
         return False
 
     sender_lower = sender_email.lower().strip()
-    sami_staff = [email.lower().strip() for email in policy.get("sami_support_staff", [])]
-
-    return sender_lower in sami_staff
+    return sender_lower in _policy_normalized_set(policy, "sami_support_staff")
 
 def send_manager_hold_notification(outlook_app, manager_email, original_msg, reason, quarantine_folder_name):
     if not outlook_app:
@@ -2901,6 +3282,7 @@ def load_processed_ledger():
 
 def save_processed_ledger(ledger):
     """Save processed ledger to JSON"""
+    _invalidate_ledger_conv_index()
     return atomic_write_json(PROCESSED_LEDGER_PATH, ledger, state_name="processed_ledger")
 
 def mark_processed(entry_id, reason, ledger=None):
@@ -2963,22 +3345,37 @@ def get_next_staff():
     
     return person
 
+# path -> ((st_dev, st_ino), header is the old 6-column schema). Appending rows
+# never changes the header, so it is only re-read when the file is replaced
+# (e.g. by maybe_rotate_daily_stats_to_new_schema).
+_stats_schema_cache = {}
+
+def _stats_header_is_old(path):
+    try:
+        st = os.stat(path)
+        identity = (st.st_dev, st.st_ino)
+    except OSError:
+        identity = None
+    cached = _stats_schema_cache.get(path)
+    if identity and identity[1] and cached is not None and cached[0] == identity:
+        return cached[1]
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            first_line = f.readline().strip()
+    except Exception:
+        return False
+    use_old_schema = bool(first_line) and len(first_line.split(',')) <= 6
+    if identity and identity[1] and first_line:
+        _stats_schema_cache[path] = (identity, use_old_schema)
+    return use_old_schema
+
 def append_stats(subject, assigned_to, sender="unknown", risk_level="normal", domain_bucket="", action="", policy_source="", event_type="", msg_key="", status_after="", assigned_ts="", completed_ts="", duration_sec="", sami_id=""):
     """Append entry to daily stats CSV with full 16-column schema"""
     try:
         file_exists = os.path.isfile(FILES["log"])
 
         # Determine column count from existing file header
-        use_old_schema = False
-        if file_exists:
-            try:
-                with open(FILES["log"], 'r', encoding='utf-8') as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        col_count = len(first_line.split(','))
-                        use_old_schema = (col_count <= 6)
-            except Exception:
-                pass
+        use_old_schema = _stats_header_is_old(FILES["log"]) if file_exists else False
 
         with open(FILES["log"], 'a', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
@@ -3068,7 +3465,7 @@ def process_reassign_queue():
         log("REASSIGN_SKIP reason=no_staff_available", "WARN")
         return
 
-    staff_set = set(s.lower() for s in staff_list)
+    staff_set = _staff_lookup_set(staff_list)
     ledger = load_processed_ledger()  # READ-ONLY — never saved back
     remaining = []
     processed_count = 0
@@ -3300,32 +3697,33 @@ def detect_risk(subject, body="", high_importance=False):
     
     Returns: ("normal", "urgent", or "critical"), risk_reason
     """
-    text = (subject + " " + body).lower()
-    
-    # Check for risk actions
-    found_actions = [a for a in RISK_ACTIONS if a in text]
-    found_context = [c for c in RISK_CONTEXT if c in text]
-    found_urgency = [u for u in URGENCY_WORDS if u in text]
-    
     # Rule 1: High Importance Flag (Outlook) = CRITICAL
     if high_importance:
         return "critical", "Outlook High Importance Flag"
+
+    text = (subject + " " + body).lower()
+
+    # Only the first hit (in dictionary order) of each category is reported,
+    # so stop scanning a category as soon as it has one.
+    found_action = next((a for a in RISK_ACTIONS if a in text), None)
+    found_context = next((c for c in RISK_CONTEXT if c in text), None) if found_action else None
+    found_urgency = next((u for u in URGENCY_WORDS if u in text), None)
     
     # Rule 2: (Action + Context) = CRITICAL (e.g., "delete patient scan")
-    if found_actions and found_context:
-        return "critical", f"Action+Context: {found_actions[0]}+{found_context[0]}"
+    if found_action and found_context:
+        return "critical", f"Action+Context: {found_action}+{found_context}"
     
     # Rule 3: (Urgency + Action) = CRITICAL (e.g., "STAT delete request")
-    if found_urgency and found_actions:
-        return "critical", f"Urgency+Action: {found_urgency[0]}+{found_actions[0]}"
+    if found_urgency and found_action:
+        return "critical", f"Urgency+Action: {found_urgency}+{found_action}"
     
     # Rule 4: Urgency words alone = URGENT
     if found_urgency:
-        return "urgent", f"Urgency: {found_urgency[0]}"
+        return "urgent", f"Urgency: {found_urgency}"
     
     # Rule 5: Risk actions alone (without context) = WARN but not critical
-    if found_actions:
-        return "urgent", f"Action detected: {found_actions[0]}"
+    if found_action:
+        return "urgent", f"Action detected: {found_action}"
     
     return "normal", None
 
@@ -3393,10 +3791,10 @@ def extract_sender_domain(sender_email):
     email_str = str(sender_email).strip()
 
     # Handle "Name <user@domain>" format
-    import re
-    match = re.search(r'<([^>]+)>', email_str)
-    if match:
-        email_str = match.group(1)
+    if '<' in email_str:
+        match = _re_bracketed_addr.search(email_str)
+        if match:
+            email_str = match.group(1)
 
     # Extract domain from email
     if '@' in email_str:
@@ -3951,6 +4349,8 @@ def process_inbox():
             global _staff_list_cache
             staff_list = get_staff_list()
             _staff_list_cache = staff_list
+            # Normalized once per tick; is_staff_sender takes a set as-is.
+            staff_sender_set = {s.lower().strip() for s in staff_list}
             if not ensure_processed_ledger_exists(PROCESSED_LEDGER_PATH):
                 log("STATE_REQUIRED_SKIP state=processed_ledger", "ERROR")
                 log(f"TICK_SKIP tick_id={tick_id} reason=STATE_REQUIRED_MISSING", "ERROR")
@@ -4023,10 +4423,14 @@ def process_inbox():
                         subject = ""
                     subject_with_id = ensure_sami_id_in_subject(subject, msg)
                     
+                    # One Body read serves both the 500-char excerpt and the HIB checks.
                     try:
-                        body = msg.Body[:500] if msg.Body else ""  # First 500 chars
+                        full_body = msg.Body or ""
+                        body = full_body[:500]  # First 500 chars
+                        hib_body = full_body[:4000]
                     except:
                         body = ""
+                        hib_body = ""
                     
                     try:
                         high_importance = (msg.Importance == 2)  # 2 = High
@@ -4093,8 +4497,8 @@ def process_inbox():
                             skipped_count += 1
                             continue
 
-                    hib_notification = is_hib_notification(msg)
-                    hib_force_16111 = hib_notification and hib_contains_16111(msg)
+                    hib_notification = is_hib_notification(msg, body=hib_body)
+                    hib_force_16111 = hib_notification and hib_contains_16111(msg, body=hib_body)
                     if hib_notification and (domain_bucket != "applications_direct" or hib_force_16111):
                         subject_prefix = re.sub(r"\d", "X", subject or "")[:60]
                         log(f"HIB_MOVE msg_id={msg_id} sender={sender_email} subject_prefix={subject_prefix}", "INFO")
@@ -4119,7 +4523,7 @@ def process_inbox():
                                     if identity.get("entry_id"):
                                         processed_ledger[message_key]["entry_id"] = identity["entry_id"]
                                     # Check for 16110 escalation before saving ledger
-                                    if hib_contains_16110(msg) and apps_cc_addr and not processed_ledger[message_key].get("apps_fwd"):
+                                    if hib_contains_16110(msg, body=hib_body) and apps_cc_addr and not processed_ledger[message_key].get("apps_fwd"):
                                         try:
                                             fwd = msg.Forward()
                                             ok = _add_and_resolve_recipients(fwd, apps_cc_list, kind="apps_team")
@@ -4149,9 +4553,9 @@ def process_inbox():
                             continue
                     # Internal staff guard - skip round-robin but allow completion
                     sender_override_matched = (match_level == "sender")
-                    if sender_override_matched and is_internal_sender(sender_email) and (not is_staff_sender(sender_email, staff_list)):
+                    if sender_override_matched and is_internal_sender(sender_email) and (not is_staff_sender(sender_email, staff_sender_set)):
                         log(f"INTERNAL_NON_STAFF_BYPASS reason=sender_override sender={sender_email} bucket={domain_bucket}", "INFO")
-                    if (not sender_override_matched) and is_internal_sender(sender_email) and is_staff_sender(sender_email, staff_list):
+                    if (not sender_override_matched) and is_internal_sender(sender_email) and is_staff_sender(sender_email, staff_sender_set):
                         if not is_completion_subject(subject):
                             if reply_chain_completion_enabled:
                                 rc_match_key, rc_sami_id, rc_match_mode, rc_failure = resolve_reply_chain_completion_match(
@@ -4197,7 +4601,7 @@ def process_inbox():
                             continue
 
                     # Internal non-staff safety guard
-                    if (not sender_override_matched) and is_internal_sender(sender_email) and (not is_staff_sender(sender_email, staff_list)):
+                    if (not sender_override_matched) and is_internal_sender(sender_email) and (not is_staff_sender(sender_email, staff_sender_set)):
                         log(f"ROUTE manager reason=internal_sender_not_in_staff sender={sender_email}", "INFO")
                         try:
                             _sb_ok, _sb_actual = check_msg_mailbox_store(msg, target_store)
@@ -4257,7 +4661,7 @@ def process_inbox():
                                     if identity.get("entry_id"):
                                         processed_ledger[message_key]["entry_id"] = identity["entry_id"]
                                     # Check for 16110 escalation before saving ledger
-                                    if hib_contains_16110(msg) and apps_cc_addr and not processed_ledger[message_key].get("apps_fwd"):
+                                    if hib_contains_16110(msg, body=hib_body) and apps_cc_addr and not processed_ledger[message_key].get("apps_fwd"):
                                         try:
                                             fwd = msg.Forward()
                                             ok = _add_and_resolve_recipients(fwd, apps_cc_list, kind="apps_team")
@@ -4388,7 +4792,7 @@ def process_inbox():
                                 if not requester or "@" not in requester:
                                     requester = CONFIG["mailbox"]
                                 assignee_email = assignee if isinstance(assignee, str) else ""
-                                staff_set = {s.lower() for s in staff_list}
+                                staff_set = _staff_lookup_set(staff_list)
                                 if assignee_email.lower() not in staff_set:
                                     skip_reason = "assignee_not_staff"
                                 else:
@@ -5042,7 +5446,7 @@ def process_inbox():
                     try:
                         requester = sender_email.strip() if isinstance(sender_email, str) else ""
                         assignee_email = assignee if isinstance(assignee, str) else ""
-                        staff_set = {s.lower() for s in staff_list}
+                        staff_set = _staff_lookup_set(staff_list)
                         if is_completion_subject(subject):
                             skip_reason = "completion_email"
                         elif assignee_email.lower() not in staff_set:
@@ -5363,8 +5767,30 @@ def run_job():
     except Exception as e:
         log(f"Error in process_reassign_queue: {e}", "ERROR")
 
+# ==================== SCHEDULER ====================
+# (next_due_monotonic, seq, interval_seconds, fn); seq breaks ties so
+# functions are never compared.
+_scheduled_jobs = []
+_scheduled_job_seq = itertools.count()
+
+def schedule_every(seconds, fn):
+    heapq.heappush(_scheduled_jobs, (time.monotonic() + seconds, next(_scheduled_job_seq), seconds, fn))
+
+def run_pending_jobs():
+    """Run every due job; the next run is timed from when the job finished."""
+    while _scheduled_jobs and _scheduled_jobs[0][0] <= time.monotonic():
+        _, seq, interval, fn = heapq.heappop(_scheduled_jobs)
+        try:
+            fn()
+        except BaseException:
+            # Leave a failed job due so the next poll retries it.
+            heapq.heappush(_scheduled_jobs, (time.monotonic(), seq, interval, fn))
+            raise
+        heapq.heappush(_scheduled_jobs, (time.monotonic() + interval, seq, interval, fn))
+
 # ==================== MAIN ENTRY POINT ====================
 if __name__ == "__main__":
+    _enable_safe_console()
     if not acquire_lock():
         sys.exit(0)
     atexit.register(release_lock)
@@ -5399,13 +5825,13 @@ if __name__ == "__main__":
         sys.exit(0)
 
     # Schedule to run every minute
-    schedule.every(CONFIG["check_interval_seconds"]).seconds.do(run_job)
+    schedule_every(CONFIG["check_interval_seconds"], run_job)
     
     log("Entering main loop (Ctrl+C to stop)")
     
     while True:
         try:
-            schedule.run_pending()
+            run_pending_jobs()
             time.sleep(1)
         except KeyboardInterrupt:
             log("Bot stopped by user", "INFO")
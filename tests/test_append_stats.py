@@ -0,0 +1,46 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import distributor
+
+
+class AppendStatsSchemaTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.tmpdir.name, "daily_stats.csv")
+        self.v2_path = os.path.join(self.tmpdir.name, "daily_stats_v2.csv")
+        self.files_patch = patch.dict(distributor.FILES, {"log": self.log_path, "log_v2": self.v2_path})
+        self.files_patch.start()
+        self.cache_patch = patch.dict(distributor._stats_schema_cache, clear=True)
+        self.cache_patch.start()
+
+    def tearDown(self):
+        self.cache_patch.stop()
+        self.files_patch.stop()
+        self.tmpdir.cleanup()
+
+    def _rows(self):
+        with open(self.log_path, newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+
+    def test_replaced_file_header_is_redetected(self):
+        with open(self.log_path, "w", newline="", encoding="utf-8") as f:
+            f.write("Date,Time,Subject,Assigned To,Sender,Risk Level\r\n")
+        distributor.append_stats("s1", "a@example.com")
+        distributor.append_stats("s2", "a@example.com")
+        self.assertEqual([len(r) for r in self._rows()[1:]], [6, 6])
+
+        os.replace(self.log_path, self.log_path + ".old")
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            f.write(",".join(["h"] * 9) + "\r\n")
+        os.replace(tmp_path, self.log_path)
+        distributor.append_stats("s3", "a@example.com")
+        self.assertEqual(len(self._rows()[1]), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
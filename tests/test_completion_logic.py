@@ -55,6 +55,37 @@ class CompletionLogicTests(unittest.TestCase):
                 processed_ledger[match_key] = entry
         self.assertEqual(processed_ledger['key-1'].get('completion_source'), 'subject_keyword')
 
+    def test_find_ledger_key_by_conversation_id_tracks_ledger_changes(self):
+        processed_ledger = {
+            'key-1': {'conversation_id': 'conv-1'},
+            'key-2': {'conversation_id': ' conv-2 '},
+            'key-3': {'conversation_id': 'conv-1'},
+        }
+        self.assertEqual(distributor.find_ledger_key_by_conversation_id(processed_ledger, 'conv-1'), 'key-1')
+        self.assertEqual(distributor.find_ledger_key_by_conversation_id(processed_ledger, 'conv-2'), 'key-2')
+        self.assertIsNone(distributor.find_ledger_key_by_conversation_id(processed_ledger, 'conv-9'))
+        processed_ledger['key-4'] = {'conversation_id': 'conv-9'}
+        self.assertEqual(distributor.find_ledger_key_by_conversation_id(processed_ledger, 'conv-9'), 'key-4')
+        processed_ledger['key-1'] = {'conversation_id': 'conv-other'}
+        self.assertEqual(distributor.find_ledger_key_by_conversation_id(processed_ledger, 'conv-1'), 'key-3')
+
+    def test_fetch_msg_fields_batches_and_falls_back(self):
+        class _Accessor:
+            def GetProperties(self, tags):
+                return ['Batched Name', -2147221233, 'Batched Subject'][:len(tags)]
+
+        msg = self._DummyMsg(subject='Attr Subject', sender_email_address='attr@example.com')
+        msg.SenderName = 'Attr Name'
+        msg.PropertyAccessor = _Accessor()
+        fields = distributor.fetch_msg_fields(msg, 'SenderName', 'SenderEmailAddress', 'Subject', 'MessageClass')
+        self.assertEqual(fields['SenderName'], 'Batched Name')
+        self.assertEqual(fields['SenderEmailAddress'], 'attr@example.com')
+        self.assertEqual(fields['Subject'], 'Batched Subject')
+        self.assertEqual(fields['MessageClass'], '')
+
+        plain = self._DummyMsg(subject='Only Attr')
+        self.assertEqual(distributor.fetch_msg_fields(plain, 'Subject'), {'Subject': 'Only Attr'})
+
     def test_build_mailto_and_prepend_html(self):
         mailto = distributor.build_completion_mailto(
             'requester@example.com',
@@ -0,0 +1,111 @@
+import asyncio
+import gzip
+import os
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import FastAPI, HTTPException
+from starlette.testclient import TestClient
+
+from dashboard.backend import server
+
+
+class DashboardRouteTableTests(unittest.TestCase):
+    def test_each_method_and_path_is_registered_once(self):
+        seen = Counter()
+        for route in server.app.routes:
+            for method in getattr(route, "methods", None) or ("*",):
+                seen[(method, route.path)] += 1
+        duplicates = sorted(key for key, count in seen.items() if count > 1)
+        self.assertEqual(duplicates, [])
+
+
+class DashboardAuthGuardTests(unittest.TestCase):
+    def test_api_requires_session_and_responses_are_not_cached(self):
+        client = TestClient(server.app)
+        with patch.object(server, "_sessions", {"valid-token"}):
+            resp = client.get("/api/settings")
+            self.assertEqual(resp.status_code, 401)
+            self.assertEqual(resp.json(), {"detail": "Not authenticated"})
+            self.assertEqual(resp.headers["cache-control"], "no-cache, no-store, must-revalidate")
+
+            client.cookies.set("session", "valid-token")
+            resp = client.get("/api/settings")
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.headers["cache-control"], "no-cache, no-store, must-revalidate")
+
+    def test_non_api_paths_skip_the_session_check(self):
+        client = TestClient(server.app)
+        with patch.object(server, "_sessions", set()):
+            self.assertNotEqual(client.get("/").status_code, 401)
+
+
+class PrecompressedStaticFilesTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = self.tmpdir.name
+        with open(os.path.join(root, "app.js"), "w", encoding="utf-8") as f:
+            f.write("console.log(1);")
+        with open(os.path.join(root, "app.js.gz"), "wb") as f:
+            f.write(gzip.compress(b"console.log(1);"))
+        self.static = server.PrecompressedStaticFiles(directory=root)
+        app = FastAPI()
+        app.mount("/", self.static)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _encoding(self, accept):
+        request = self.client.build_request("GET", "/app.js", headers={"accept-encoding": accept})
+        resp = self.client.send(request, stream=True)
+        resp.close()
+        return resp.headers.get("content-encoding")
+
+    def test_precompressed_sibling_respects_q_values(self):
+        self.assertEqual(self._encoding("gzip, deflate"), "gzip")
+        self.assertIsNone(self._encoding("gzip;q=0"))
+        self.assertIsNone(self._encoding("*, gzip;q=0"))
+        self.assertIsNone(self._encoding("identity"))
+
+    def test_missing_files_are_not_cached(self):
+        for i in range(50):
+            self.assertEqual(self.client.get(f"/missing{i}.js").status_code, 404)
+        self.assertEqual(len(self.static._stat_cache), 0)
+        self.client.get("/app.js")
+        self.assertIn("app.js", self.static._stat_cache)
+
+
+class UpdateSettingValidationTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path_patch = patch.object(
+            server.config, "SETTINGS_OVERRIDES_JSON", Path(self.tmpdir.name) / "settings_overrides.json"
+        )
+        self.path_patch.start()
+
+    def tearDown(self):
+        self.path_patch.stop()
+        self.tmpdir.cleanup()
+
+    def _update(self, value):
+        body = server.SettingUpdate(key="manager_cc_addr", value=value)
+        return asyncio.run(server.update_setting(body))
+
+    def test_empty_parts_are_ignored_like_the_bot(self):
+        for value in ("a@x.com;", "a@x.com; ;b@y.com"):
+            result = self._update(value)
+            self.assertEqual(result["settings"]["manager_cc_addr"], value)
+
+    def test_rejects_values_without_a_valid_address(self):
+        for value in (";", " ; ", "a@x.com;not-an-email", "a@@x.com"):
+            with self.assertRaises(HTTPException) as ctx:
+                self._update(value)
+            self.assertEqual(ctx.exception.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
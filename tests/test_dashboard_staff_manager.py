@@ -0,0 +1,47 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from dashboard.backend import staff_manager
+
+
+class StaffManagerTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "staff.txt"
+        self.path.write_text("a@example.com\nB@example.com\n", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_add_staff_returns_updated_list(self):
+        ok, msg, staff = staff_manager.add_staff(self.path, " C@Example.com ")
+        self.assertTrue(ok, msg)
+        self.assertEqual(staff, ["a@example.com", "B@example.com", "c@example.com"])
+        self.assertEqual(staff_manager.read_staff(self.path), staff)
+
+    def test_add_staff_rejects_case_insensitive_duplicate(self):
+        ok, _msg, staff = staff_manager.add_staff(self.path, "b@example.com")
+        self.assertFalse(ok)
+        self.assertEqual(staff, ["a@example.com", "B@example.com"])
+
+    def test_remove_staff_returns_updated_list(self):
+        ok, msg, staff = staff_manager.remove_staff(self.path, "b@example.com")
+        self.assertTrue(ok, msg)
+        self.assertEqual(staff, ["a@example.com"])
+        self.assertEqual(staff_manager.read_staff(self.path), ["a@example.com"])
+
+    def test_remove_staff_missing_returns_unchanged_list(self):
+        ok, _msg, staff = staff_manager.remove_staff(self.path, "zz@example.com")
+        self.assertFalse(ok)
+        self.assertEqual(staff, ["a@example.com", "B@example.com"])
+
+    def test_add_staff_rejects_invalid_email(self):
+        for bad in ("no-at.example.com", "a@b@example.com", "a@example.com trailing", "x" * 250 + "@ex.com"):
+            ok, _msg, staff = staff_manager.add_staff(self.path, bad)
+            self.assertFalse(ok, bad)
+            self.assertEqual(staff, ["a@example.com", "B@example.com"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import distributor
+
+
+class HotConfigReloadTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "apps_team.json")
+        self.state = {"seen_fp": None, "seen_sha": None, "lkg": None, "lkg_sha": None}
+        self.state_patch = patch.dict(distributor._hot_config_state, {"test_cfg": self.state})
+        self.state_patch.start()
+
+    def tearDown(self):
+        self.state_patch.stop()
+        self.tmpdir.cleanup()
+
+    def _write(self, text, mtime_ns):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def _reload(self):
+        return distributor._reload_hot_json(
+            "test_cfg",
+            self.path,
+            lambda obj: distributor._parse_recipients_json(obj, name="apps_team"),
+        )
+
+    def test_invalid_file_reported_once_and_not_reread_while_unchanged(self):
+        self._write(json.dumps({"recipients": ["a@example.com"]}), 1_000_000_000)
+        cfg, evt = self._reload()
+        self.assertEqual(cfg, {"recipients": ["a@example.com"]})
+        self.assertEqual(evt["event_type"], "CONFIG_CHANGED")
+
+        self._write("{not json", 2_000_000_000)
+        cfg, evt = self._reload()
+        self.assertEqual(cfg, {"recipients": ["a@example.com"]})
+        self.assertEqual(evt["event_type"], "CONFIG_INVALID")
+
+        with patch("builtins.open", side_effect=AssertionError("unchanged file re-read")):
+            cfg, evt = self._reload()
+        self.assertEqual(cfg, {"recipients": ["a@example.com"]})
+        self.assertIsNone(evt)
+
+    def test_same_content_new_fingerprint_is_not_a_change(self):
+        body = json.dumps({"recipients": ["a@example.com", "A@example.com"]})
+        self._write(body, 1_000_000_000)
+        self.assertEqual(self._reload()[1]["event_type"], "CONFIG_CHANGED")
+        self._write(body, 3_000_000_000)
+        cfg, evt = self._reload()
+        self.assertEqual(cfg, {"recipients": ["a@example.com"]})
+        self.assertIsNone(evt)
+
+
+if __name__ == "__main__":
+    unittest.main()